@@ -6,24 +6,64 @@ This module provides comprehensive benchmarks for the async agent system,
 measuring performance, scalability, and correctness.
 """
 
+import array
 import asyncio
 import csv
+import functools
 import json
 import time
+import timeit
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from LambdaCat.agents.actions import choose, parallel, sequence, task
 from LambdaCat.agents.cognition.memory import AgentState
-from LambdaCat.agents.core.async_runtime import run_plan_async
+from LambdaCat.agents.core.compile_async import run_plan as run_plan_async
 from LambdaCat.agents.core.effect import Effect
 from LambdaCat.agents.core.instruments import get_observability
 from LambdaCat.agents.core.patch import patch_combine
 from LambdaCat.agents.tools.http import create_http_adapter
-from LambdaCat.agents.tools.llm import create_mock_llm
+from LambdaCat.agents.tools.llm import LLMAdapter, create_mock_llm
 from LambdaCat.agents.tools.search import create_mock_search_adapter
 
+try:
+    import uvloop
+    _HAS_UVLOOP = True
+except ImportError:
+    _HAS_UVLOOP = False
+    uvloop = None
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+    orjson = None
+
+
+def _measure(fn: Callable[[], Any]) -> float:
+    """Return the mean duration of ``fn`` in ms, auto-scaling the repeat count."""
+    number, total = timeit.Timer(fn).autorange()
+    return (total / number) * 1000
+
+
+def _make_action(name: str, delay: float):
+    """Create a test action that sleeps for ``delay`` and marks ``name`` in state."""
+    async def action(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(delay)
+        new_state = state.copy()
+        new_state[name] = True
+        return new_state
+    return action
+
+
+@functools.lru_cache(maxsize=8)
+def _make_action_registry(count: int, delay: float) -> dict[str, Any]:
+    """Build (once per ``(count, delay)``) a registry of ``action_0..action_{count-1}``."""
+    return {f"action_{i}": _make_action(f"action_{i}", delay) for i in range(count)}
+
 
 @dataclass
 class BenchmarkResult:
@@ -46,48 +86,111 @@ class BenchmarkResult:
         }
 
 
+class _Results:
+    """Columnar (struct-of-arrays) store for benchmark results.
+
+    Durations live in a contiguous ``array('d')`` and success flags in a
+    ``bytearray``; indexing or iterating yields ``BenchmarkResult`` row views.
+    """
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.durations_ms = array.array("d")
+        self.success = bytearray()
+        self.errors: list[str | None] = []
+        self.metadata: list[dict[str, Any]] = []
+
+    def append(self, result: BenchmarkResult) -> None:
+        """Append a result, splitting it across the columns."""
+        self.names.append(result.name)
+        self.durations_ms.append(result.duration_ms)
+        self.success.append(result.success)
+        self.errors.append(result.error)
+        self.metadata.append(result.metadata or {})
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, i: int) -> BenchmarkResult:
+        return BenchmarkResult(
+            name=self.names[i],
+            duration_ms=self.durations_ms[i],
+            success=bool(self.success[i]),
+            error=self.errors[i],
+            metadata=self.metadata[i]
+        )
+
+    def __iter__(self) -> Iterator[BenchmarkResult]:
+        return map(self.__getitem__, range(len(self)))
+
+    def rows(self) -> list[dict[str, Any]]:
+        """Return every result as a plain dict, reading the columns in one pass."""
+        return [
+            {"name": name, "duration_ms": duration, "success": bool(ok), "error": error, "metadata": metadata}
+            for name, duration, ok, error, metadata in zip(
+                self.names, self.durations_ms, self.success, self.errors, self.metadata, strict=True
+            )
+        ]
+
+
 class AsyncAgentBenchmarks:
     """Comprehensive benchmark suite for async agent system."""
 
     def __init__(self, output_dir: str = "benchmark_results"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.results: list[BenchmarkResult] = []
+        self.results = _Results()
         self.obs = get_observability()
 
-    async def run_all_benchmarks(self) -> list[BenchmarkResult]:
-        """Run all benchmarks."""
-        print("🚀 Starting Async Agent Benchmarks")
-        print("=" * 50)
-
-        # Core Effect benchmarks
-        await self._benchmark_effect_creation()
-        await self._benchmark_effect_composition()
-        await self._benchmark_effect_parallel()
+        # Results stream here while run_all_benchmarks is running
+        self._jsonl: TextIO | None = None
 
-        # Runtime benchmarks
-        await self._benchmark_sequential_plans()
-        await self._benchmark_parallel_plans()
-        await self._benchmark_choose_plans()
+        # Search and HTTP adapters keep no per-call state, so they are built
+        # once and shared. LLM adapters carry a rate limiter and circuit
+        # breaker, so each timed region gets a fresh one from _new_llm
+        self._llm_responses = [f"Response {i}" for i in range(100)]
+        self.search = create_mock_search_adapter()
+        self.http = create_http_adapter()
 
-        # Tool adapter benchmarks
-        await self._benchmark_llm_adapter()
-        await self._benchmark_http_adapter()
-        await self._benchmark_search_adapter()
+    def _new_llm(self) -> LLMAdapter:
+        """Mock LLM with a full rate-limit bucket, so no region inherits another's waits."""
+        return create_mock_llm(responses=self._llm_responses)
 
-        # Memory and beliefs benchmarks
-        await self._benchmark_memory_operations()
-        await self._benchmark_belief_updates()
-
-        # Scalability benchmarks
-        await self._benchmark_scalability()
-        await self._benchmark_concurrent_agents()
+    async def run_all_benchmarks(self) -> _Results:
+        """Run all benchmarks."""
+        print("🚀 Starting Async Agent Benchmarks")
+        print("=" * 50)
 
-        # Error handling benchmarks
-        await self._benchmark_error_handling()
+        # Each result is streamed here as it is recorded (line-buffered), so
+        # progress is visible on disk and a crashed run keeps what it finished.
+        # The file is rewritten per run, so results start over with it
+        self.results = _Results()
+        jsonl_path = self.output_dir / "benchmark_results.jsonl"
+        try:
+            with jsonl_path.open("w", buffering=1) as self._jsonl:
+                # Benchmarks run one at a time: a perf_counter window shared
+                # with other work on the loop would time that work too, and the
+                # result order would vary between runs
+                await self._benchmark_effect_creation()
+                await self._benchmark_effect_composition()
+                await self._benchmark_effect_parallel()
+                await self._benchmark_sequential_plans()
+                await self._benchmark_parallel_plans()
+                await self._benchmark_choose_plans()
+                await self._benchmark_llm_adapter()
+                await self._benchmark_http_adapter()
+                await self._benchmark_search_adapter()
+                await self._benchmark_memory_operations()
+                await self._benchmark_belief_updates()
+                await self._benchmark_scalability()
+                await self._benchmark_concurrent_agents()
+                await self._benchmark_error_handling()
+        finally:
+            self._jsonl = None
+            await self.http.close()
 
         # Save results
-        await self._save_results()
+        self._save_results()
 
         print(f"✅ Completed {len(self.results)} benchmarks")
         return self.results
@@ -97,11 +200,11 @@ class AsyncAgentBenchmarks:
         print("📊 Benchmarking Effect creation...")
 
         # Effect creation
-        start_time = time.perf_counter()
-        effects = [Effect.pure(f"value_{i}") for i in range(1000)]
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        values = [f"value_{i}" for i in range(1000)]
+        effects = Effect.pure_many(values)
+        duration_ms = _measure(lambda: Effect.pure_many(values))
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="effect_creation_1000",
             duration_ms=duration_ms,
             success=True,
@@ -109,11 +212,9 @@ class AsyncAgentBenchmarks:
         ))
 
         # Effect mapping
-        start_time = time.perf_counter()
-        [effect.map(lambda x: x.upper()) for effect in effects[:100]]
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = _measure(lambda: [effect.map(str.upper) for effect in effects[:100]])
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="effect_mapping_100",
             duration_ms=duration_ms,
             success=True,
@@ -131,28 +232,34 @@ class AsyncAgentBenchmarks:
                 effect = effect.bind(lambda x, i=i: Effect.pure(f"{x}_{i}"))
             return effect
 
-        # Test different chain lengths
+        def create_fused_chain(length: int) -> Effect[dict[str, Any], str]:
+            """Create the same chain as a single fused Effect."""
+            return Effect.chain_pure("start", [lambda x, i=i: f"{x}_{i}" for i in range(length)])
+
+        # Test different chain lengths; the bind chain is the semantic baseline
         for length in [10, 50, 100, 200]:
-            start_time = time.perf_counter()
-            effect = create_effect_chain(length)
-            # Run the effect
-            state = {"data": "test"}
-            ctx = {}
-            await effect.run(state, ctx)
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            for name, create in (("effect_chain", create_effect_chain),
+                                 ("effect_chain_fused", create_fused_chain)):
+                start_time = time.perf_counter()
+                effect = create(length)
+                # Run the effect
+                state = {"data": "test"}
+                ctx = {}
+                await effect.run(state, ctx)
+                duration_ms = (time.perf_counter() - start_time) * 1000
 
-            self.results.append(BenchmarkResult(
-                name=f"effect_chain_{length}",
-                duration_ms=duration_ms,
-                success=True,
-                metadata={"chain_length": length, "avg_per_bind": duration_ms / length}
-            ))
+                self._record(BenchmarkResult(
+                    name=f"{name}_{length}",
+                    duration_ms=duration_ms,
+                    success=True,
+                    metadata={"chain_length": length, "avg_per_bind": duration_ms / length}
+                ))
 
     async def _benchmark_effect_parallel(self):
         """Benchmark parallel Effect composition."""
         print("📊 Benchmarking parallel Effects...")
 
-        async def create_parallel_effect(count: int) -> Effect[dict[str, Any], tuple[str, ...]]:
+        def create_parallel_effect(count: int) -> Effect[dict[str, Any], tuple[str, ...]]:
             """Create parallel effects."""
             effects = [Effect.pure(f"value_{i}") for i in range(count)]
             return Effect.par_mapN(patch_combine, *effects)
@@ -166,7 +273,7 @@ class AsyncAgentBenchmarks:
             await effect.run(state, ctx)
             duration_ms = (time.perf_counter() - start_time) * 1000
 
-            self.results.append(BenchmarkResult(
+            self._record(BenchmarkResult(
                 name=f"effect_parallel_{count}",
                 duration_ms=duration_ms,
                 success=True,
@@ -177,29 +284,19 @@ class AsyncAgentBenchmarks:
         """Benchmark sequential plan execution."""
         print("📊 Benchmarking sequential plans...")
 
-        async def create_action(name: str, delay: float = 0.001):
-            """Create a test action."""
-            async def action(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
-                await asyncio.sleep(delay)
-                return {**state, name: True}
-            return action
-
-        # Create action registry
-        actions = {}
-        for i in range(20):
-            actions[f"action_{i}"] = await create_action(f"action_{i}")
+        actions = _make_action_registry(20, 0.001)
 
         # Test different plan lengths
         for length in [5, 10, 15, 20]:
             plan = sequence(*[task(f"action_{i}") for i in range(length)])
 
-            start_time = time.perf_counter()
             state = {"data": "test"}
             ctx = {}
+            start_time = time.perf_counter()
             await run_plan_async(plan, actions, state, ctx)
             duration_ms = (time.perf_counter() - start_time) * 1000
 
-            self.results.append(BenchmarkResult(
+            self._record(BenchmarkResult(
                 name=f"sequential_plan_{length}",
                 duration_ms=duration_ms,
                 success=True,
@@ -210,25 +307,15 @@ class AsyncAgentBenchmarks:
         """Benchmark parallel plan execution."""
         print("📊 Benchmarking parallel plans...")
 
-        async def create_action(name: str, delay: float = 0.01):
-            """Create a test action."""
-            async def action(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
-                await asyncio.sleep(delay)
-                return {**state, name: True}
-            return action
-
-        # Create action registry
-        actions = {}
-        for i in range(20):
-            actions[f"action_{i}"] = await create_action(f"action_{i}")
+        actions = _make_action_registry(20, 0.01)
 
         # Test different parallel counts
         for count in [2, 5, 10, 15, 20]:
             plan = parallel(*[task(f"action_{i}") for i in range(count)])
 
-            start_time = time.perf_counter()
             state = {"data": "test"}
             ctx = {}
+            start_time = time.perf_counter()
             await run_plan_async(plan, actions, state, ctx)
             duration_ms = (time.perf_counter() - start_time) * 1000
 
@@ -236,7 +323,7 @@ class AsyncAgentBenchmarks:
             sequential_time = count * 0.01 * 1000  # Expected sequential time
             speedup = sequential_time / duration_ms if duration_ms > 0 else 0
 
-            self.results.append(BenchmarkResult(
+            self._record(BenchmarkResult(
                 name=f"parallel_plan_{count}",
                 duration_ms=duration_ms,
                 success=True,
@@ -251,29 +338,19 @@ class AsyncAgentBenchmarks:
         """Benchmark choose plan execution."""
         print("📊 Benchmarking choose plans...")
 
-        async def create_action(name: str, delay: float = 0.01):
-            """Create a test action."""
-            async def action(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
-                await asyncio.sleep(delay)
-                return {**state, name: True}
-            return action
-
-        # Create action registry
-        actions = {}
-        for i in range(10):
-            actions[f"action_{i}"] = await create_action(f"action_{i}")
+        actions = _make_action_registry(10, 0.01)
 
         # Test different choice counts
         for count in [2, 5, 10]:
             plan = choose(*[task(f"action_{i}") for i in range(count)])
 
-            start_time = time.perf_counter()
             state = {"data": "test"}
             ctx = {}
+            start_time = time.perf_counter()
             await run_plan_async(plan, actions, state, ctx)
             duration_ms = (time.perf_counter() - start_time) * 1000
 
-            self.results.append(BenchmarkResult(
+            self._record(BenchmarkResult(
                 name=f"choose_plan_{count}",
                 duration_ms=duration_ms,
                 success=True,
@@ -284,15 +361,13 @@ class AsyncAgentBenchmarks:
         """Benchmark LLM adapter performance."""
         print("📊 Benchmarking LLM adapter...")
 
-        # Create mock LLM
-        llm = create_mock_llm(responses=[f"Response {i}" for i in range(100)])
-
         # Test single completion
+        llm = self._new_llm()
         start_time = time.perf_counter()
         response = await llm.complete("Test prompt")
         duration_ms = (time.perf_counter() - start_time) * 1000
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="llm_single_completion",
             duration_ms=duration_ms,
             success=True,
@@ -300,24 +375,46 @@ class AsyncAgentBenchmarks:
         ))
 
         # Test batch completions
+        llm = self._new_llm()
         start_time = time.perf_counter()
         tasks = [llm.complete(f"Prompt {i}") for i in range(10)]
         await asyncio.gather(*tasks)
         duration_ms = (time.perf_counter() - start_time) * 1000
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="llm_batch_10",
             duration_ms=duration_ms,
             success=True,
             metadata={"batch_size": 10, "avg_per_completion": duration_ms / 10}
         ))
 
+        # Same batch awaited in one coroutine, on its own fresh adapter so both
+        # variants start from a full rate-limit bucket. gather overlaps the
+        # mock's 100ms latency and the fused loop pays it per call, so the gap
+        # is mostly that latency, not Task overhead
+        async def complete_all(llm: LLMAdapter, n: int) -> list[Any]:
+            responses = []
+            for i in range(n):
+                responses.append(await llm.complete(f"Prompt {i}"))
+            return responses
+
+        llm = self._new_llm()
+        start_time = time.perf_counter()
+        await complete_all(llm, 10)
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        self._record(BenchmarkResult(
+            name="llm_batch_10_fused",
+            duration_ms=duration_ms,
+            success=True,
+            metadata={"batch_size": 10, "avg_per_completion": duration_ms / 10}
+        ))
+
     async def _benchmark_http_adapter(self):
         """Benchmark HTTP adapter performance."""
         print("📊 Benchmarking HTTP adapter...")
 
-        # Create HTTP adapter
-        http = create_http_adapter()
+        http = self.http
 
         # Test single request (will fail with mock, but we can measure setup time)
         start_time = time.perf_counter()
@@ -327,28 +424,25 @@ class AsyncAgentBenchmarks:
             pass  # Expected to fail in test environment
         duration_ms = (time.perf_counter() - start_time) * 1000
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="http_single_request",
             duration_ms=duration_ms,
             success=False,  # Expected to fail
             error="Mock HTTP request failed"
         ))
 
-        await http.close()
-
     async def _benchmark_search_adapter(self):
         """Benchmark search adapter performance."""
         print("📊 Benchmarking search adapter...")
 
-        # Create mock search adapter
-        search = create_mock_search_adapter()
+        search = self.search
 
         # Test single search
         start_time = time.perf_counter()
         results = await search.search("test query", num_results=10)
         duration_ms = (time.perf_counter() - start_time) * 1000
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="search_single_query",
             duration_ms=duration_ms,
             success=True,
@@ -361,23 +455,38 @@ class AsyncAgentBenchmarks:
         await asyncio.gather(*tasks)
         duration_ms = (time.perf_counter() - start_time) * 1000
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="search_batch_5",
             duration_ms=duration_ms,
             success=True,
             metadata={"batch_size": 5, "avg_per_query": duration_ms / 5}
         ))
 
+        async def search_all(n: int) -> list[Any]:
+            batches = []
+            for i in range(n):
+                batches.append(await search.search(f"query {i}"))
+            return batches
+
+        start_time = time.perf_counter()
+        await search_all(5)
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        self._record(BenchmarkResult(
+            name="search_batch_5_fused",
+            duration_ms=duration_ms,
+            success=True,
+            metadata={"batch_size": 5, "avg_per_query": duration_ms / 5}
+        ))
+
     async def _benchmark_memory_operations(self):
         """Benchmark memory operations."""
         print("📊 Benchmarking memory operations...")
 
         # Test AgentState creation
-        start_time = time.perf_counter()
-        [AgentState() for _ in range(1000)]
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = _measure(lambda: [AgentState() for _ in range(1000)])
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="memory_agent_state_creation_1000",
             duration_ms=duration_ms,
             success=True,
@@ -385,54 +494,75 @@ class AsyncAgentBenchmarks:
         ))
 
         # Test memory operations
-        state = AgentState()
-        start_time = time.perf_counter()
-        for i in range(1000):
-            state = state.remember(f"key_{i}", f"value_{i}")
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        def remember_1000() -> None:
+            state = AgentState()
+            for i in range(1000):
+                state = state.remember(f"key_{i}", f"value_{i}")
+
+        duration_ms = _measure(remember_1000)
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="memory_remember_1000",
             duration_ms=duration_ms,
             success=True,
             metadata={"count": 1000, "avg_per_operation": duration_ms / 1000}
         ))
 
+        entries = {f"key_{i}": f"value_{i}" for i in range(1000)}
+        duration_ms = _measure(lambda: AgentState().remember_many(entries))
+
+        self._record(BenchmarkResult(
+            name="memory_remember_many_1000",
+            duration_ms=duration_ms,
+            success=True,
+            metadata={"count": 1000, "avg_per_operation": duration_ms / 1000}
+        ))
+
         # Test belief updates
         from LambdaCat.agents.cognition.beliefs import create_belief_system
-        belief_system = create_belief_system()
 
-        start_time = time.perf_counter()
-        for i in range(1000):
-            belief_system = belief_system.add_belief(f"proposition_{i}", 0.5)
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        def add_beliefs_1000() -> None:
+            belief_system = create_belief_system()
+            for i in range(1000):
+                belief_system = belief_system.add_belief(f"proposition_{i}", 0.5)
 
-        self.results.append(BenchmarkResult(
+        duration_ms = _measure(add_beliefs_1000)
+
+        self._record(BenchmarkResult(
             name="memory_belief_add_1000",
             duration_ms=duration_ms,
             success=True,
             metadata={"count": 1000, "avg_per_belief": duration_ms / 1000}
         ))
 
+        pairs = [(f"proposition_{i}", 0.5) for i in range(1000)]
+        duration_ms = _measure(lambda: create_belief_system().add_beliefs(pairs))
+
+        self._record(BenchmarkResult(
+            name="memory_belief_add_many_1000",
+            duration_ms=duration_ms,
+            success=True,
+            metadata={"count": 1000, "avg_per_belief": duration_ms / 1000}
+        ))
+
     async def _benchmark_belief_updates(self):
         """Benchmark belief update operations."""
         print("📊 Benchmarking belief updates...")
 
         from LambdaCat.agents.cognition.beliefs import create_belief_system
 
-        belief_system = create_belief_system()
-
         # Add initial beliefs
-        for i in range(100):
-            belief_system = belief_system.add_belief(f"prop_{i}", 0.0)
+        belief_system = create_belief_system().add_beliefs((f"prop_{i}", 0.0) for i in range(100))
 
         # Test belief updates
-        start_time = time.perf_counter()
-        for i in range(1000):
-            belief_system = belief_system.update_belief(f"prop_{i % 100}", 0.1)
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        def update_beliefs_1000() -> None:
+            updated = belief_system
+            for i in range(1000):
+                updated = updated.update_belief(f"prop_{i % 100}", 0.1)
 
-        self.results.append(BenchmarkResult(
+        duration_ms = _measure(update_beliefs_1000)
+
+        self._record(BenchmarkResult(
             name="belief_update_1000",
             duration_ms=duration_ms,
             success=True,
@@ -440,11 +570,9 @@ class AsyncAgentBenchmarks:
         ))
 
         # Test belief decay
-        start_time = time.perf_counter()
-        belief_system = belief_system.decay_all_beliefs()
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = _measure(belief_system.decay_all_beliefs)
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="belief_decay_100",
             duration_ms=duration_ms,
             success=True,
@@ -455,15 +583,9 @@ class AsyncAgentBenchmarks:
         """Benchmark system scalability."""
         print("📊 Benchmarking scalability...")
 
-        async def create_scalable_plan(parallel_count: int, sequential_depth: int):
+        def create_scalable_plan(parallel_count: int, sequential_depth: int):
             """Create a scalable plan."""
-            # Create actions
-            actions = {}
-            for i in range(parallel_count * sequential_depth):
-                async def action(state: dict[str, Any], ctx: dict[str, Any], idx: int = i) -> dict[str, Any]:
-                    await asyncio.sleep(0.001)  # Small delay
-                    return {**state, f"action_{idx}": True}
-                actions[f"action_{i}"] = action
+            actions = _make_action_registry(parallel_count * sequential_depth, 0.001)
 
             # Create plan with parallel branches, each with sequential depth
             branches = []
@@ -473,33 +595,37 @@ class AsyncAgentBenchmarks:
 
             return parallel(*branches), actions
 
-        # Test different scales
-        for parallel_count in [2, 5, 10]:
-            for sequential_depth in [2, 5]:
-                plan, actions = await create_scalable_plan(parallel_count, sequential_depth)
+        # Build every plan up front so only execution is timed
+        scales = {
+            (parallel_count, sequential_depth): create_scalable_plan(parallel_count, sequential_depth)
+            for parallel_count in [2, 5, 10]
+            for sequential_depth in [2, 5]
+        }
 
-                start_time = time.perf_counter()
-                state = {"data": "test"}
-                ctx = {}
-                await run_plan_async(plan, actions, state, ctx)
-                duration_ms = (time.perf_counter() - start_time) * 1000
+        # Test different scales
+        for (parallel_count, sequential_depth), (plan, actions) in scales.items():
+            state = {"data": "test"}
+            ctx = {}
+            start_time = time.perf_counter()
+            await run_plan_async(plan, actions, state, ctx)
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
-                self.results.append(BenchmarkResult(
-                    name=f"scalability_p{parallel_count}_s{sequential_depth}",
-                    duration_ms=duration_ms,
-                    success=True,
-                    metadata={
-                        "parallel_count": parallel_count,
-                        "sequential_depth": sequential_depth,
-                        "total_actions": parallel_count * sequential_depth
-                    }
-                ))
+            self._record(BenchmarkResult(
+                name=f"scalability_p{parallel_count}_s{sequential_depth}",
+                duration_ms=duration_ms,
+                success=True,
+                metadata={
+                    "parallel_count": parallel_count,
+                    "sequential_depth": sequential_depth,
+                    "total_actions": parallel_count * sequential_depth
+                }
+            ))
 
     async def _benchmark_concurrent_agents(self):
         """Benchmark concurrent agent execution."""
         print("📊 Benchmarking concurrent agents...")
 
-        async def create_agent(agent_id: str, work_duration: float = 0.01):
+        def create_agent(agent_id: str, work_duration: float = 0.01):
             """Create a test agent."""
             async def agent_work():
                 await asyncio.sleep(work_duration)
@@ -514,7 +640,7 @@ class AsyncAgentBenchmarks:
             results = await asyncio.gather(*[agent() for agent in agents])
             duration_ms = (time.perf_counter() - start_time) * 1000
 
-            self.results.append(BenchmarkResult(
+            self._record(BenchmarkResult(
                 name=f"concurrent_agents_{agent_count}",
                 duration_ms=duration_ms,
                 success=True,
@@ -554,7 +680,7 @@ class AsyncAgentBenchmarks:
             pass  # Expected to fail
         duration_ms = (time.perf_counter() - start_time) * 1000
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="error_handling_sequential",
             duration_ms=duration_ms,
             success=False,
@@ -573,74 +699,86 @@ class AsyncAgentBenchmarks:
             pass  # Expected to fail
         duration_ms = (time.perf_counter() - start_time) * 1000
 
-        self.results.append(BenchmarkResult(
+        self._record(BenchmarkResult(
             name="error_handling_parallel",
             duration_ms=duration_ms,
             success=False,
             error="Expected failure in parallel plan"
         ))
 
-    async def _save_results(self):
-        """Save benchmark results to files."""
-        # Save JSON results
-        json_file = self.output_dir / "benchmark_results.json"
-        with open(json_file, "w") as f:
-            json.dump([result.to_dict() for result in self.results], f, indent=2)
+    def _record(self, result: BenchmarkResult) -> None:
+        """Store ``result`` and, during a full run, append it to the JSON Lines stream."""
+        self.results.append(result)
+        if self._jsonl is None:
+            return
+        if _HAS_ORJSON:
+            line = orjson.dumps(result.to_dict()).decode()
+        else:
+            line = json.dumps(result.to_dict())
+        self._jsonl.write(line + "\n")
+
+    def _save_results(self):
+        """Save the CSV and Markdown summary; JSON Lines were written by ``_record``.
+
+        Plain blocking writes: the files are small and written once at the end
+        of the run, so a thread hop (``asyncio.to_thread``) would only add cost.
+        """
+        rows = self.results.rows()
+        meta_keys = sorted({key for row in rows for key in row["metadata"]})
 
-        # Save CSV results
         csv_file = self.output_dir / "benchmark_results.csv"
-        with open(csv_file, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["name", "duration_ms", "success", "error", "metadata"])
-            writer.writeheader()
-            for result in self.results:
-                row = result.to_dict()
-                # Flatten metadata
-                if row["metadata"]:
-                    for key, value in row["metadata"].items():
-                        row[f"meta_{key}"] = value
-                    del row["metadata"]
-                writer.writerow(row)
-
-        # Generate summary report
-        await self._generate_summary_report()
-
-        print(f"📁 Results saved to {self.output_dir}")
-
-    async def _generate_summary_report(self):
-        """Generate a summary report."""
         report_file = self.output_dir / "benchmark_summary.md"
 
-        successful_results = [r for r in self.results if r.success]
-        failed_results = [r for r in self.results if not r.success]
+        successful_lines = []
+        failed_lines = []
 
-        with open(report_file, "w") as f:
-            f.write("# Async Agent System Benchmark Results\n\n")
-            f.write(f"**Total Benchmarks:** {len(self.results)}\n")
-            f.write(f"**Successful:** {len(successful_results)}\n")
-            f.write(f"**Failed:** {len(failed_results)}\n\n")
-
-            if successful_results:
-                f.write("## Performance Summary\n\n")
-                f.write("| Benchmark | Duration (ms) | Notes |\n")
-                f.write("|-----------|---------------|-------|\n")
-
-                for result in successful_results:
-                    metadata_str = ", ".join([f"{k}={v}" for k, v in (result.metadata or {}).items()])
-                    f.write(f"| {result.name} | {result.duration_ms:.2f} | {metadata_str} |\n")
-
-            if failed_results:
-                f.write("\n## Failed Benchmarks\n\n")
-                f.write("| Benchmark | Error |\n")
-                f.write("|-----------|-------|\n")
+        with open(csv_file, "w", newline="") as f:
+            writer = csv.writer(f)
+            # Flatten metadata into meta_* columns
+            writer.writerow(["name", "duration_ms", "success", "error", *(f"meta_{k}" for k in meta_keys)])
+            for row in rows:
+                metadata = row["metadata"]
+                writer.writerow([
+                    row["name"], row["duration_ms"], row["success"], row["error"],
+                    *(metadata.get(k, "") for k in meta_keys)
+                ])
+                if row["success"]:
+                    metadata_str = ", ".join(f"{k}={v}" for k, v in metadata.items())
+                    successful_lines.append(f"| {row['name']} | {row['duration_ms']:.2f} | {metadata_str} |\n")
+                else:
+                    failed_lines.append(f"| {row['name']} | {row['error']} |\n")
+
+        parts = [
+            "# Async Agent System Benchmark Results\n\n",
+            f"**Total Benchmarks:** {len(rows)}\n",
+            f"**Successful:** {len(successful_lines)}\n",
+            f"**Failed:** {len(failed_lines)}\n\n",
+        ]
+
+        if successful_lines:
+            parts.append("## Performance Summary\n\n")
+            parts.append("| Benchmark | Duration (ms) | Notes |\n")
+            parts.append("|-----------|---------------|-------|\n")
+            parts.extend(successful_lines)
+
+        if failed_lines:
+            parts.append("\n## Failed Benchmarks\n\n")
+            parts.append("| Benchmark | Error |\n")
+            parts.append("|-----------|-------|\n")
+            parts.extend(failed_lines)
+
+        parts.append(
+            "\n## Recommendations\n\n"
+            "- Monitor performance trends over time\n"
+            "- Set performance baselines for CI/CD\n"
+            "- Investigate any failed benchmarks\n"
+            "- Consider optimization for slow operations\n"
+        )
 
-                for result in failed_results:
-                    f.write(f"| {result.name} | {result.error} |\n")
+        with open(report_file, "w") as f:
+            f.write("".join(parts))
 
-            f.write("\n## Recommendations\n\n")
-            f.write("- Monitor performance trends over time\n")
-            f.write("- Set performance baselines for CI/CD\n")
-            f.write("- Investigate any failed benchmarks\n")
-            f.write("- Consider optimization for slow operations\n")
+        print(f"📁 Results saved to {self.output_dir}")
 
 
 async def main():
@@ -666,4 +804,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop's libuv-backed loop cuts per-await scheduling cost; fall back to
+    # the default asyncio loop when it isn't installed.
+    if _HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
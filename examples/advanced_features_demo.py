@@ -5,12 +5,16 @@ Advanced Features Demo
 Shows limits, adjunctions, and Kleisli categories in LambdaCat.
 """
 
+import importlib.util
+import re
 import sys
+import zlib
 from pathlib import Path
 
-# Add src to path for imports
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+# Fall back to the in-repo src/ only when LambdaCat isn't installed
+if importlib.util.find_spec("LambdaCat") is None:
+    src_path = Path(__file__).parent.parent / "src"
+    sys.path.insert(0, str(src_path))
 
 print("Advanced Features Demo")
 print("=" * 30)
@@ -120,8 +124,10 @@ print("\n4. Email Validation Pipeline")
 
 result_cat = kleisli_category_for('Result', ['String', 'Email', 'User'])
 
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 def validate_email(s: str) -> Result[str, str]:
-    if '@' in s and '.' in s.split('@')[1]:
+    if _EMAIL_RE.match(s):
         return Result.ok(s)
     else:
         return Result.err(f"Invalid email format: {s}")
@@ -129,7 +135,8 @@ def validate_email(s: str) -> Result[str, str]:
 def create_user(email: str) -> Result[dict, str]:
     return Result.ok({
         'email': email,
-        'id': hash(email) % 10000,
+        # crc32, not hash(): str hashes are salted per process
+        'id': zlib.crc32(email.encode()) % 10000,
         'status': 'active'
     })
 
@@ -1,6 +1,9 @@
 """Demo of agent entities - persistent agents with goals and intentions."""
 
 import asyncio
+import logging
+import sys
+from logging.handlers import MemoryHandler
 from typing import Any
 
 from src.LambdaCat.agents.actions import Task, sequence
@@ -10,11 +13,23 @@ from src.LambdaCat.agents.entities import (
     create_agent_entity,
 )
 
+# Skill progress goes through a buffered handler and is written out in one
+# go after each demo's agents stop, instead of a stdout write per step.
+_log_buffer = MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=logging.StreamHandler(sys.stdout))
+log = logging.getLogger("lambdacat.demo")
+log.addHandler(_log_buffer)
+log.setLevel(logging.INFO)
+log.propagate = False
+
+# Skills update the plan state in place: AgentEntity.act_once builds a fresh
+# top-level dict for every cycle and these plans are purely sequential, so no
+# other step can observe the mutation.
+
 
 async def research_skill(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
     """Research skill that simulates web search."""
     query = state.get("query", "")
-    print(f"Researching: {query}")
+    log.info("Researching: %s", query)
 
     results = [
         f"Research result 1 for '{query}'",
@@ -22,7 +37,8 @@ async def research_skill(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str
         f"Research result 3 for '{query}'"
     ]
 
-    return {**state, "search_results": results}
+    state["search_results"] = results
+    return state
 
 
 async def synthesize_skill(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
@@ -30,23 +46,26 @@ async def synthesize_skill(state: dict[str, Any], ctx: dict[str, Any]) -> dict[s
     results = state.get("research_results", [])
     query = state.get("query", "")
 
-    print(f"Synthesizing {len(results)} results for: {query}")
+    log.info("Synthesizing %d results for: %s", len(results), query)
 
-    synthesis = f"Based on {len(results)} research sources, here's what I found about '{query}':\n"
-    synthesis += "\n".join(f"- {result}" for result in results)
+    # One join plus one format; join is handed a list so it can size the result up front
+    bullets = "\n".join([f"- {result}" for result in results])
+    synthesis = f"Based on {len(results)} research sources, here's what I found about '{query}':\n{bullets}"
 
-    return {**state, "synthesis": synthesis, "success": True}
+    state.update(synthesis=synthesis, success=True)
+    return state
 
 
 async def review_skill(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
     """Review skill that evaluates the synthesis."""
     synthesis = state.get("synthesis", "")
 
-    print("Reviewing synthesis quality...")
+    log.info("Reviewing synthesis quality...")
 
     quality_score = min(1.0, len(synthesis) / 100.0)
 
-    return {**state, "quality_score": quality_score, "reviewed": True}
+    state.update(quality_score=quality_score, reviewed=True)
+    return state
 
 
 async def watchdog_skill(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
@@ -54,15 +73,16 @@ async def watchdog_skill(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str
     event = state.get("current_event", {})
     event_type = event.get("type", "unknown")
 
-    print(f"Monitoring event: {event_type}")
+    log.info("Monitoring event: %s", event_type)
 
     if event_type == "alert":
         severity = event.get("severity", "low")
-        print(f"Alert detected with severity: {severity}")
-        return {**state, "alert_handled": True, "severity": severity}
+        log.info("Alert detected with severity: %s", severity)
+        state.update(alert_handled=True, severity=severity)
     else:
-        print("No issues detected")
-        return {**state, "status": "normal"}
+        log.info("No issues detected")
+        state["status"] = "normal"
+    return state
 
 
 async def create_research_agent() -> Any:
@@ -132,46 +152,46 @@ async def run_agent_entity_demo():
     print()
 
     print("Starting agents...")
-    research_task = asyncio.create_task(research_agent.run())
-    watchdog_task = asyncio.create_task(watchdog_agent.run())
-
-    await asyncio.sleep(0.1)
-
-    print("\nSending research request...")
-    research_message = Message.create(
-        topic="research",
-        payload={
-            "observation": {
-                "query": "artificial intelligence trends 2024",
-                "type": "research_request"
-            }
-        },
-        sender="user"
-    )
-    await research_agent.inbox.put(research_message)
-
-    print("\nSending monitoring event...")
-    monitor_message = Message.create(
-        topic="monitoring",
-        payload={
-            "observation": {
-                "type": "alert",
-                "severity": "high",
-                "message": "System overload detected"
-            }
-        },
-        sender="system"
-    )
-    await watchdog_agent.inbox.put(monitor_message)
+    # The group waits for both agent loops to exit after stop()
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(research_agent.run())
+        tg.create_task(watchdog_agent.run())
+
+        print("\nSending research request...")
+        research_message = Message.create(
+            topic="research",
+            payload={
+                "observation": {
+                    "query": "artificial intelligence trends 2024",
+                    "type": "research_request"
+                }
+            },
+            sender="user"
+        )
+        await research_agent.inbox.put(research_message)
+
+        print("\nSending monitoring event...")
+        monitor_message = Message.create(
+            topic="monitoring",
+            payload={
+                "observation": {
+                    "type": "alert",
+                    "severity": "high",
+                    "message": "System overload detected"
+                }
+            },
+            sender="system"
+        )
+        await watchdog_agent.inbox.put(monitor_message)
 
-    print("\nLetting agents process...")
-    await asyncio.sleep(2.0)
+        print("\nLetting agents process...")
+        await asyncio.sleep(2.0)
 
-    print("\nStopping agents...")
-    await research_agent.stop()
-    await watchdog_agent.stop()
+        print("\nStopping agents...")
+        await research_agent.stop()
+        await watchdog_agent.stop()
 
-    await asyncio.gather(research_task, watchdog_task, return_exceptions=True)
+    _log_buffer.flush()
 
     print("\nResults:")
     print(f"Research Agent Memory: {len(research_agent.state.memory)} entries")
@@ -227,31 +247,31 @@ async def run_multi_agent_coordination_demo():
 
     print(f"Created {len(agents)} specialized research agents")
 
-    tasks = [asyncio.create_task(agent.run()) for agent in agents]
-
-    await asyncio.sleep(0.1)
-
-    for i, agent in enumerate(agents):
-        message = Message.create(
-            topic="research",
-            payload={
-                "observation": {
-                    "query": f"Latest trends in {specializations[i][1]}",
-                    "type": "research_request"
-                }
-            },
-            sender="coordinator"
-        )
-        await agent.inbox.put(message)
-
-    print("\nSent research requests to all agents...")
-
-    await asyncio.sleep(3.0)
-
-    for agent in agents:
-        await agent.stop()
-
-    await asyncio.gather(*tasks, return_exceptions=True)
+    async with asyncio.TaskGroup() as tg:
+        for agent in agents:
+            tg.create_task(agent.run())
+
+        for i, agent in enumerate(agents):
+            message = Message.create(
+                topic="research",
+                payload={
+                    "observation": {
+                        "query": f"Latest trends in {specializations[i][1]}",
+                        "type": "research_request"
+                    }
+                },
+                sender="coordinator"
+            )
+            agent.deliver_many([message])
+
+        print("\nSent research requests to all agents...")
+
+        # Each stop message queues behind its agent's request, so every agent
+        # processes its request and then exits; the agents run concurrently and
+        # the demo waits for the slowest one instead of a fixed 3s sleep.
+        await asyncio.gather(*(agent.stop() for agent in agents))
+
+    _log_buffer.flush()
 
     print("\nCoordination Results:")
     for agent in agents:
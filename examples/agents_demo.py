@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any, Callable
@@ -23,15 +24,29 @@ def to_lower(x: str, ctx: Any | None = None) -> str:
     return x.lower()
 
 
+class _NoiseTable(dict):
+    """str.translate table that fills itself in for each codepoint it meets."""
+
+    def __missing__(self, cp: int) -> int | None:
+        ch = chr(cp)
+        self[cp] = cp if ch.isalnum() or ch.isspace() else None
+        return self[cp]
+
+
+_NOISE_TABLE = _NoiseTable()
+
+
 def remove_noise(x: str, ctx: Any | None = None) -> str:
-    allowed = []
-    for ch in x:
-        if ch.isalnum() or ch.isspace():
-            allowed.append(ch)
-    return "".join(allowed)
+    return x.translate(_NOISE_TABLE)
+
+
+# Anything normalize_ws would change: a whitespace run or non-space whitespace
+_WS_TO_NORMALIZE = re.compile(r"\s\s|[^\S ]")
 
 
 def normalize_ws(x: str, ctx: Any | None = None) -> str:
+    if not (x and (x[0] == " " or x[-1] == " ")) and not _WS_TO_NORMALIZE.search(x):
+        return x  # already normalized
     return " ".join(x.split())
 
 
@@ -43,9 +58,7 @@ def summarize_head(x: str, ctx: Any | None = None) -> str:
 
 def extract_keywords(x: str, ctx: Any | None = None) -> str:
     # unique words longer than 3 chars
-    words = [w for w in x.split() if len(w) > 3]
-    uniq = sorted(set(words))
-    return " ".join(uniq)
+    return " ".join(sorted({w for w in x.split() if len(w) > 3}))
 
 
 def to_upper(x: str, ctx: Any | None = None) -> str:
@@ -64,17 +77,37 @@ Implementation: Mapping[str, Callable[..., str]] = {
 }
 
 
-# Demo 1: Linear plan comparison
+def has_noise(s: str) -> bool:
+    return "!!" in s
 
-def demo_linear_plan(input_text: str) -> None:
-    plan_a = sequence(Task("strip_ws"), Task("remove_noise"), Task("normalize_ws"))
-    plan_b = sequence(Task("strip_ws"), Task("to_lower"), Task("normalize_ws"))
 
-    executable_a = compile_plan(Implementation, plan_a)
-    executable_b = compile_plan(Implementation, plan_b)
+# Plans and their compiled executables are built once at import time;
+# the demos below only run them.
+
+PLAN_A = sequence(Task("strip_ws"), Task("remove_noise"), Task("normalize_ws"))
+PLAN_B = sequence(Task("strip_ws"), Task("to_lower"), Task("normalize_ws"))
+SIMPLE_PLAN = sequence(Task("strip_ws"), Task("to_lower"), Task("normalize_ws"))
+STRUCTURED_PLAN = sequence(
+    Task("strip_ws"),
+    Task("remove_noise"),
+    parallel(Task("summarize_head"), Task("extract_keywords")),
+    choose(Task("to_upper"), Task("identity")),
+)
+LOOP_PLAN = sequence(
+    loop_while(has_noise, Task("remove_noise")),
+    choose(Task("to_upper"), Task("identity")),
+)
+
+EXEC_A = compile_plan(Implementation, PLAN_A)
+EXEC_B = compile_plan(Implementation, PLAN_B)
+EXEC_SIMPLE = compile_plan(Implementation, SIMPLE_PLAN)
 
-    result_a = executable_a(input_text)
-    result_b = executable_b(input_text)
+
+# Demo 1: Linear plan comparison
+
+def demo_linear_plan(input_text: str) -> None:
+    result_a = EXEC_A(input_text)
+    result_b = EXEC_B(input_text)
 
     # pick the shorter one
     if len(result_a) <= len(result_b):
@@ -93,20 +126,13 @@ def demo_linear_plan(input_text: str) -> None:
 # Demo 2: Structured plan (parallel + choose)
 
 def demo_structured_plan(input_text: str) -> None:
-    plan = sequence(
-        Task("strip_ws"),
-        Task("remove_noise"),
-        parallel(Task("summarize_head"), Task("extract_keywords")),
-        choose(Task("to_upper"), Task("identity")),
-    )
-
     def aggregate_parallel(results):
         return " | ".join(str(r) for r in results)
 
     def choose_first(results):
         return 0  # always pick first option
 
-    executable = compile_plan(Implementation, plan,
+    executable = compile_plan(Implementation, STRUCTURED_PLAN,
                             aggregate_fn=aggregate_parallel,
                             choose_fn=choose_first)
     result = executable(input_text)
@@ -114,7 +140,7 @@ def demo_structured_plan(input_text: str) -> None:
     print(f"[Structured] output: {result}")
 
     # also try with Kleisli
-    kleisli_plan = compile_to_kleisli(Implementation, plan, Option)
+    kleisli_plan = compile_to_kleisli(Implementation, STRUCTURED_PLAN, Option)
     kleisli_result = kleisli_plan(input_text)
     print(f"[Structured] Kleisli result: {kleisli_result}")
 
@@ -157,21 +183,13 @@ def demo_focus_plan(article: Article) -> None:
 # Demo 4: Loop + choose
 
 def demo_loop_and_choose(input_text: str) -> None:
-    def has_noise(s: str) -> bool:
-        return "!!" in s
-
-    plan = sequence(
-        loop_while(has_noise, Task("remove_noise")),
-        choose(Task("to_upper"), Task("identity")),
-    )
-
     # pick the longer result
     def choose_longest(results):
         if not results:
             return 0
         return max(range(len(results)), key=lambda i: len(str(results[i])))
 
-    executable = compile_plan(Implementation, plan, choose_fn=choose_longest)
+    executable = compile_plan(Implementation, LOOP_PLAN, choose_fn=choose_longest)
     result = executable(input_text)
 
     print(f"[Loop+Choose] input: {input_text}")
@@ -181,15 +199,8 @@ def demo_loop_and_choose(input_text: str) -> None:
 # Demo 5: Simple sequential execution
 
 def demo_simple_execution() -> None:
-    plan = sequence(
-        Task("strip_ws"),
-        Task("to_lower"),
-        Task("normalize_ws")
-    )
-
-    executable = compile_plan(Implementation, plan)
     sample = "  HELLO, World!!  "
-    result = executable(sample)
+    result = EXEC_SIMPLE(sample)
 
     print(f"[Simple] input: '{sample}'")
     print(f"[Simple] output: '{result}'")
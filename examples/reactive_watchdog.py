@@ -9,7 +9,9 @@ an environment and responds to events using the async agent system.
 import asyncio
 import random
 import time
-from typing import Any
+from collections import deque
+from itertools import islice
+from typing import Any, ClassVar
 
 from LambdaCat.agents.cognition.beliefs import create_belief_system
 from LambdaCat.agents.cognition.memory import AgentState
@@ -20,12 +22,24 @@ from LambdaCat.agents.core.bus import create_agent_communicator, create_bus
 from LambdaCat.agents.core.instruments import get_observability
 from LambdaCat.agents.core.persistence import PersistenceManager, create_backend
 
+# (metric, high threshold, high event, low threshold, low event); a None low
+# threshold means the metric has no "too low" event
+METRIC_THRESHOLDS = (
+    ("cpu_usage", 80, "high_cpu", 20, "low_cpu"),
+    ("memory_usage", 85, "high_memory", 30, "low_memory"),
+    ("error_rate", 0.1, "high_errors", None, None),
+)
+
+CRITICAL_EVENT_TYPES = frozenset({"high_cpu", "high_memory", "high_errors", "security_alert"})
+
 
 class Environment:
     """Simulated environment that generates events."""
 
-    def __init__(self):
-        self.events = []
+    def __init__(self, max_events: int = 10_000):
+        # Bounded history: old events fall off instead of growing forever
+        self.events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._event_seq = 0
         self.running = False
         self.metrics = {
             "cpu_usage": 0.0,
@@ -66,35 +80,35 @@ class Environment:
         ]
 
         while self.running:
-            # Generate events based on metrics
-            if self.metrics["cpu_usage"] > 80:
-                await self._emit_event("high_cpu", {"cpu_usage": self.metrics["cpu_usage"]})
-            elif self.metrics["cpu_usage"] < 20:
-                await self._emit_event("low_cpu", {"cpu_usage": self.metrics["cpu_usage"]})
+            # One clock read per tick, shared by every event it emits
+            now = time.time()
 
-            if self.metrics["memory_usage"] > 85:
-                await self._emit_event("high_memory", {"memory_usage": self.metrics["memory_usage"]})
-            elif self.metrics["memory_usage"] < 30:
-                await self._emit_event("low_memory", {"memory_usage": self.metrics["memory_usage"]})
-
-            if self.metrics["error_rate"] > 0.1:
-                await self._emit_event("high_errors", {"error_rate": self.metrics["error_rate"]})
+            # Generate events based on metrics
+            for metric, high, high_event, low, low_event in METRIC_THRESHOLDS:
+                value = self.metrics[metric]
+                if value > high:
+                    await self._emit_event(high_event, {metric: value}, now)
+                elif low is not None and value < low:
+                    await self._emit_event(low_event, {metric: value}, now)
 
             # Random events
             if random.random() < 0.1:  # 10% chance per second
                 event_type = random.choice(event_types)
-                await self._emit_event(event_type, {"random": True})
+                await self._emit_event(event_type, {"random": True}, now)
 
             await asyncio.sleep(1.0)
 
-    async def _emit_event(self, event_type: str, data: dict[str, Any]):
+    async def _emit_event(
+        self, event_type: str, data: dict[str, Any], timestamp: float | None = None
+    ):
         """Emit an event."""
         event = {
             "type": event_type,
-            "timestamp": time.time(),
+            "timestamp": time.time() if timestamp is None else timestamp,
             "data": data,
-            "id": f"event_{len(self.events)}"
+            "id": f"event_{self._event_seq}"
         }
+        self._event_seq += 1
         self.events.append(event)
         print(f"🔔 Event: {event_type} - {data}")
 
@@ -104,13 +118,15 @@ class Environment:
 
     def get_recent_events(self, count: int = 10) -> list[dict[str, Any]]:
         """Get recent events."""
-        return self.events[-count:]
+        return list(islice(self.events, max(0, len(self.events) - count), None))
 
 
 class WatchdogAgent:
     """Reactive watchdog agent that monitors and responds to events."""
 
-    def __init__(self, agent_id: str, bus, persistence: PersistenceManager):
+    def __init__(
+        self, agent_id: str, bus, persistence: PersistenceManager, monitor_interval: float = 1.0
+    ):
         self.agent_id = agent_id
         self.bus = bus
         self.persistence = persistence
@@ -119,6 +135,15 @@ class WatchdogAgent:
         self.policy = None
         self.obs = get_observability()
         self.running = False
+        # A timer task sets this event; the reactive loop wakes on it or on a message
+        self.monitor_interval = monitor_interval
+        self._monitor_event = asyncio.Event()
+        self._monitor_task: asyncio.Task | None = None
+        # Persisted state only changes when we save it, so reload lazily
+        self._cached_agent_state: AgentState | None = None
+        self._agent_state_dirty = True
+        # BeliefSystem is immutable, so its serialized form is valid until replaced
+        self._beliefs_snapshot: tuple[Any, dict[str, Any]] | None = None
 
         # Initialize beliefs
         self._initialize_beliefs()
@@ -176,8 +201,8 @@ class WatchdogAgent:
             return 1.0  # No events = stable
 
         # Count critical events
-        critical_events = [e for e in events if e.get("type") in ["high_cpu", "high_memory", "high_errors", "security_alert"]]
-        stability_score = 1.0 - min(len(critical_events) / 10, 1.0)
+        n_critical = sum(1 for e in events if e.get("type") in CRITICAL_EVENT_TYPES)
+        stability_score = 1.0 - min(n_critical / 10, 1.0)
 
         return stability_score
 
@@ -201,33 +226,53 @@ class WatchdogAgent:
         self.communicator = await create_agent_communicator(self.agent_id, self.bus)
         self.running = True
 
-        # Start reactive loop
+        # Start monitor timer and reactive loop
+        self._monitor_task = asyncio.create_task(self._monitor_timer())
         asyncio.create_task(self._reactive_loop())
 
     async def stop(self):
         """Stop the watchdog agent."""
         self.running = False
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+        # Wake the reactive loop so it notices the stop immediately
+        self._monitor_event.set()
+
+    async def _monitor_timer(self):
+        """Signal the reactive loop to monitor once per interval."""
+        while self.running:
+            await asyncio.sleep(self.monitor_interval)
+            self._monitor_event.set()
 
     async def _reactive_loop(self):
-        """Main reactive loop."""
+        """Main reactive loop: handle messages as they arrive, monitor on timer ticks."""
         inbox = await self.communicator.get_inbox()
+        inbox_wait = asyncio.ensure_future(inbox.get())
+        monitor_wait = asyncio.ensure_future(self._monitor_event.wait())
 
-        while self.running:
-            try:
-                # Check for messages with timeout
+        try:
+            while self.running:
                 try:
-                    message = await asyncio.wait_for(inbox.get(), timeout=1.0)
-                    await self._handle_message(message)
-                except asyncio.TimeoutError:
-                    # No message, continue monitoring
-                    pass
-
-                # Periodic monitoring
-                await self._monitor_system()
-
-            except Exception as e:
-                print(f"❌ Watchdog error: {e}")
-                await asyncio.sleep(1.0)
+                    done, _ = await asyncio.wait(
+                        {inbox_wait, monitor_wait}, return_when=asyncio.FIRST_COMPLETED
+                    )
+
+                    if inbox_wait in done:
+                        received, inbox_wait = inbox_wait, asyncio.ensure_future(inbox.get())
+                        await self._handle_message(received.result())
+
+                    if monitor_wait in done:
+                        self._monitor_event.clear()
+                        monitor_wait = asyncio.ensure_future(self._monitor_event.wait())
+                        if self.running:
+                            await self._monitor_system()
+
+                except Exception as e:
+                    print(f"❌ Watchdog error: {e}")
+                    await asyncio.sleep(1.0)
+        finally:
+            inbox_wait.cancel()
+            monitor_wait.cancel()
 
     async def _handle_message(self, message):
         """Handle incoming messages."""
@@ -258,13 +303,11 @@ class WatchdogAgent:
 
     async def _get_current_state(self) -> dict[str, Any]:
         """Get current system state."""
-        # Load from persistence
-        agent_state = await self.persistence.load_agent_state(self.agent_id)
-        if not agent_state:
-            agent_state = AgentState()
+        agent_state = await self._get_agent_state()
 
         # Get environment data (in real system, this would come from monitoring)
         # For demo, we'll use simulated data
+        now = time.time()
         state = {
             "metrics": {
                 "cpu_usage": random.uniform(20, 90),
@@ -274,15 +317,31 @@ class WatchdogAgent:
                 "error_rate": random.uniform(0, 0.2)
             },
             "recent_events": [
-                {"type": "high_cpu", "timestamp": time.time() - 10},
-                {"type": "low_memory", "timestamp": time.time() - 5}
+                {"type": "high_cpu", "timestamp": now - 10},
+                {"type": "low_memory", "timestamp": now - 5}
             ],
             "agent_state": agent_state.to_dict(),
-            "beliefs": self.belief_system.to_dict()
+            "beliefs": self._beliefs_dict()
         }
 
         return state
 
+    async def _get_agent_state(self) -> AgentState:
+        """Load persisted state, reusing the last load until it is invalidated."""
+        if self._agent_state_dirty or self._cached_agent_state is None:
+            agent_state = await self.persistence.load_agent_state(self.agent_id)
+            self._cached_agent_state = agent_state or AgentState()
+            self._agent_state_dirty = False
+        return self._cached_agent_state
+
+    def _beliefs_dict(self) -> dict[str, Any]:
+        """Serialized beliefs, rebuilt only when the belief system changes."""
+        snapshot = self._beliefs_snapshot
+        if snapshot is None or snapshot[0] is not self.belief_system:
+            snapshot = (self.belief_system, self.belief_system.to_dict())
+            self._beliefs_snapshot = snapshot
+        return snapshot[1]
+
     async def _update_beliefs_from_environment(self, env_data: dict[str, Any]):
         """Update beliefs based on environment data."""
         metrics = env_data.get("metrics", {})
@@ -295,24 +354,17 @@ class WatchdogAgent:
 
         if cpu > 80 or memory > 85 or errors > 0.1:
             # System needs attention
-            self.belief_system = self.belief_system.update_belief(
-                "needs_attention", 1.0, "environment_monitoring"
-            )
-            self.belief_system = self.belief_system.update_belief(
-                "system_healthy", -1.0, "environment_monitoring"
+            self.belief_system = self.belief_system.update_beliefs(
+                [("needs_attention", 1.0), ("system_healthy", -1.0)], "environment_monitoring"
             )
         else:
             # System is healthy
-            self.belief_system = self.belief_system.update_belief(
-                "system_healthy", 0.5, "environment_monitoring"
-            )
-            self.belief_system = self.belief_system.update_belief(
-                "needs_attention", -0.5, "environment_monitoring"
+            self.belief_system = self.belief_system.update_beliefs(
+                [("system_healthy", 0.5), ("needs_attention", -0.5)], "environment_monitoring"
             )
 
         # Check for critical events
-        critical_events = [e for e in events if e.get("type") in ["high_cpu", "high_memory", "high_errors", "security_alert"]]
-        if critical_events:
+        if any(e.get("type") in CRITICAL_EVENT_TYPES for e in events):
             self.belief_system = self.belief_system.update_belief(
                 "critical_issue", 2.0, "critical_events"
             )
@@ -323,15 +375,14 @@ class WatchdogAgent:
         success = feedback.get("success", False)
         effectiveness = feedback.get("effectiveness", 0.5)
 
+        belief_key = self._EFFECTIVE_KEYS.get(action) or f"{action}_effective"
         if success:
             # Action was successful, increase belief in effectiveness
-            belief_key = f"{action}_effective"
             self.belief_system = self.belief_system.update_belief(
                 belief_key, effectiveness, "action_feedback"
             )
         else:
             # Action failed, decrease belief in effectiveness
-            belief_key = f"{action}_effective"
             self.belief_system = self.belief_system.update_belief(
                 belief_key, -effectiveness, "action_feedback"
             )
@@ -340,16 +391,9 @@ class WatchdogAgent:
         """Execute the selected action."""
         print(f"🤖 {self.agent_id} executing action: {action}")
 
-        if action == "monitor":
-            await self._action_monitor(state)
-        elif action == "alert":
-            await self._action_alert(state)
-        elif action == "restart_service":
-            await self._action_restart_service(state)
-        elif action == "scale_up":
-            await self._action_scale_up(state)
-        elif action == "investigate":
-            await self._action_investigate(state)
+        handler = self._ACTIONS.get(action)
+        if handler is not None:
+            await handler(self, state)
 
     async def _action_monitor(self, state: dict[str, Any]):
         """Monitor action - just observe and log."""
@@ -409,13 +453,25 @@ class WatchdogAgent:
             "investigate_effective", 0.1, "action_execution"
         )
 
+    # Dispatch table for _execute_action (plain functions, called with self)
+    _ACTIONS: ClassVar[dict[str, Any]] = {
+        "monitor": _action_monitor,
+        "alert": _action_alert,
+        "restart_service": _action_restart_service,
+        "scale_up": _action_scale_up,
+        "investigate": _action_investigate,
+    }
+    # Feedback belief keys for known actions, built once
+    _EFFECTIVE_KEYS: ClassVar[dict[str, str]] = {action: f"{action}_effective" for action in _ACTIONS}
+
     async def save_state(self):
         """Save agent state to persistence."""
         agent_state = AgentState(
-            data={"beliefs": self.belief_system.to_dict()},
+            data={"beliefs": self._beliefs_dict()},
             memory={"last_update": time.time()}
         )
         await self.persistence.save_agent_state(self.agent_id, agent_state)
+        self._agent_state_dirty = True
 
 
 async def run_watchdog_demo():
@@ -4,9 +4,15 @@ Research Agent Example
 Shows how to build a research pipeline using LambdaCat's agent framework.
 """
 
+import asyncio
+import functools
+import heapq
 import re
 import time
-from dataclasses import dataclass, field
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
 from typing import Any
 
 from LambdaCat.agents.actions import Task, parallel, sequence
@@ -15,15 +21,15 @@ from LambdaCat.core.fp.instances.result import Result
 from LambdaCat.core.fp.kleisli import Kleisli
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResearchQuery:
     question: str
     domain: str = "general"
     depth: str = "comprehensive"
-    sources: set[str] = field(default_factory=lambda: {"academic", "web"})
+    sources: frozenset[str] = frozenset({"academic", "web"})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResearchEvidence:
     content: str
     source: str
@@ -40,7 +46,7 @@ class KnowledgeSource:
     name: str
     reliability: float
     latency: float
-    specialties: set[str]
+    specialties: frozenset[str]
 
 
 # Mock data sources
@@ -49,70 +55,154 @@ KNOWLEDGE_SOURCES = {
         "Academic Papers",
         reliability=0.95,
         latency=2.0,
-        specialties={"science", "technology"}
+        specialties=frozenset({"science", "technology"})
     ),
     "web": KnowledgeSource(
         "Web Search",
         reliability=0.65,
         latency=1.0,
-        specialties={"news", "general"}
+        specialties=frozenset({"news", "general"})
     ),
     "expert": KnowledgeSource(
         "Expert Network",
         reliability=0.85,
         latency=5.0,
-        specialties={"industry", "analysis"}
+        specialties=frozenset({"industry", "analysis"})
     )
 }
 
 
+# Search results are deterministic per (source, concepts), so repeat queries
+# skip the simulated latency until the entry expires. Least recently used
+# entries are evicted past _SEARCH_CACHE_MAX, like parse_query's lru_cache.
+_SEARCH_TTL = 3600.0
+_SEARCH_CACHE_MAX = 1024
+_search_cache: OrderedDict[tuple[str, tuple[str, ...]], tuple[float, tuple[tuple[str, float, float], ...]]] = (
+    OrderedDict()
+)
+
+
+def clear_research_cache() -> None:
+    """Drop cached searches and parsed queries."""
+    _search_cache.clear()
+    parse_query.cache_clear()
+
+
+_WORD_RE = re.compile(r'\b\w{3,}\b')
+_STOP_WORDS = frozenset({"the", "a", "an", "is", "are", "what", "how", "why"})
+
+
 # Research functions
+@functools.lru_cache(maxsize=1024)
 def parse_query(query_text: str) -> ResearchQuery:
     """Parse natural language into structured query."""
     domain = "general"
-    if any(term in query_text.lower() for term in ["AI", "machine learning"]):
+    lowered = query_text.lower()
+    if any(term in lowered for term in ["AI", "machine learning"]):
         domain = "artificial_intelligence"
-    elif any(term in query_text.lower() for term in ["quantum", "physics"]):
+    elif any(term in lowered for term in ["quantum", "physics"]):
         domain = "physics"
     return ResearchQuery(
         question=query_text.strip(),
         domain=domain,
-        sources={"academic", "web", "expert"}
+        sources=frozenset({"academic", "web", "expert"})
     )
 
 
 def extract_concepts(query: ResearchQuery) -> set[str]:
     """Extract key concepts from query."""
-    stop_words = {"the", "a", "an", "is", "are", "what", "how", "why"}
-    words = re.findall(r'\b\w{3,}\b', query.question.lower())
-    return {word for word in words if word not in stop_words}
+    return set(_WORD_RE.findall(query.question.lower())) - _STOP_WORDS
 
 
-def search_source(source_name: str, concepts: set[str]) -> list[ResearchEvidence]:
-    """Search a knowledge source for information."""
+async def search_source(
+    source_name: str, concepts: set[str], ctx: Any = None
+) -> list[ResearchEvidence]:
+    """Search a knowledge source for information.
+
+    ``ctx`` is accepted so ``functools.partial(search_source, name)`` can be
+    registered directly as an async plan action.
+    """
     source = KNOWLEDGE_SOURCES.get(source_name)
     if not source:
         return []
 
-    # Simulate search
-    time.sleep(source.latency * 0.1)  # Reduced for demo
-
-    evidence = []
-    for concept in list(concepts)[:3]:  # Limit for demo
-        confidence = min(source.reliability + (hash(concept) % 20) / 100, 1.0)
-        relevance = max(0.3, (hash(f"{source_name}{concept}") % 100) / 100)
-
-        content = f"Research from {source.name} on '{concept}': " \
-                 f"Key findings show relevant insights for the field."
-
-        evidence.append(ResearchEvidence(
+    # Only the first few concepts in sorted order are searched, so the choice is
+    # independent of set order and overlapping concept sets share entries
+    key = (source_name, tuple(heapq.nsmallest(3, concepts)))  # Limit for demo
+    cached = _search_cache.get(key)
+    if cached is None or cached[0] <= time.monotonic():
+        # Simulate search latency without blocking the event loop
+        await asyncio.sleep(source.latency * 0.1)  # Reduced for demo
+        cached = (time.monotonic() + _SEARCH_TTL, _source_findings(source_name, source, key[1]))
+        _search_cache[key] = cached
+        if len(_search_cache) > _SEARCH_CACHE_MAX:
+            _search_cache.popitem(last=False)
+    _search_cache.move_to_end(key)
+
+    # Timestamps are per call, so they stay outside the cache
+    timestamp = time.time()
+    return [
+        ResearchEvidence(
             content=content,
             source=source.name,
             confidence=confidence,
             relevance_score=relevance,
-            timestamp=time.time()
-        ))
+            timestamp=timestamp
+        )
+        for content, confidence, relevance in cached[1]
+    ]
+
+
+def _source_findings(
+    source_name: str, source: KnowledgeSource, concepts: tuple[str, ...]
+) -> tuple[tuple[str, float, float], ...]:
+    """Deterministic (content, confidence, relevance) rows for a search."""
+    findings = []
+    for concept in concepts:
+        # crc32, not hash(): str hashes are salted per process, so scores
+        # would differ between runs
+        confidence = min(source.reliability + (zlib.crc32(concept.encode()) % 20) / 100, 1.0)
+        relevance = max(0.3, (zlib.crc32((source_name + concept).encode()) % 100) / 100)
 
+        content = f"Research from {source.name} on '{concept}': " \
+                 f"Key findings show relevant insights for the field."
+        findings.append((content, confidence, relevance))
+
+    return tuple(findings)
+
+
+async def search_all_sources(
+    concepts: set[str],
+    source_names: tuple[str, ...] = ("academic", "web", "expert"),
+    min_sources: int = 2,
+    max_results: int | None = None,
+    confidence_gate: float = 0.9
+) -> list[ResearchEvidence]:
+    """Search sources concurrently, stopping early once the evidence is good enough.
+
+    After at least ``min_sources`` have answered, the remaining searches are
+    cancelled when ``max_results`` high-quality pieces are in hand or the
+    average confidence exceeds ``confidence_gate``.
+    """
+    tasks = [asyncio.create_task(search_source(name, concepts)) for name in source_names]
+    evidence: list[ResearchEvidence] = []
+    confidence_total = 0.0
+    high_quality = 0
+    try:
+        for done, future in enumerate(asyncio.as_completed(tasks), start=1):
+            batch = await future
+            evidence.extend(batch)
+            confidence_total += sum(e.confidence for e in batch)
+            high_quality += sum(1 for e in batch if e.quality_score() > 0.5)
+            if done < min_sources or not evidence:
+                continue
+            if max_results is not None and high_quality >= max_results:
+                break
+            if confidence_total / len(evidence) > confidence_gate:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
     return evidence
 
 
@@ -121,12 +211,14 @@ def synthesize_findings(evidence_list: list[ResearchEvidence]) -> dict[str, Any]
     if not evidence_list:
         return {"summary": "No evidence found", "confidence": 0.0}
 
-    # Sort by quality
-    sorted_evidence = sorted(evidence_list, key=lambda e: e.quality_score(), reverse=True)
-    evidence_to_use = [e for e in sorted_evidence if e.quality_score() > 0.5][:10]
+    # Score each piece once, then select the top 10 above threshold without a full sort
+    qualities = [e.quality_score() for e in evidence_list]
+    candidates = [i for i, q in enumerate(qualities) if q > 0.5]
+    top = heapq.nlargest(10, candidates, key=qualities.__getitem__)
+    evidence_to_use = [evidence_list[i] for i in top]
 
     sources = {e.source for e in evidence_to_use}
-    avg_confidence = sum(e.quality_score() for e in evidence_to_use) / len(evidence_to_use)
+    avg_confidence = sum(qualities[i] for i in top) / len(top)
 
     summary = f"Analysis of {len(evidence_to_use)} pieces of evidence from " \
              f"{len(sources)} sources reveals consistent patterns in the research domain."
@@ -140,18 +232,22 @@ def synthesize_findings(evidence_list: list[ResearchEvidence]) -> dict[str, Any]
 
 
 # Agent actions
+def combine_evidence(evidence_lists: list[Any]) -> list[ResearchEvidence]:
+    """Flatten per-source evidence lists; items that are already evidence pass through."""
+    return list(chain.from_iterable(
+        batch if isinstance(batch, list) else (batch,) for batch in evidence_lists
+    ))
+
+
 def create_actions():
     """Create action registry for research agent."""
     return {
         "parse_query": parse_query,
         "extract_concepts": extract_concepts,
-        "search_academic": lambda concepts: search_source("academic", concepts),
-        "search_web": lambda concepts: search_source("web", concepts),
-        "search_expert": lambda concepts: search_source("expert", concepts),
-        "combine_evidence": lambda evidence_lists: [
-            item for sublist in evidence_lists
-            for item in (sublist if isinstance(sublist, list) else [sublist])
-        ],
+        "search_academic": functools.partial(search_source, "academic"),
+        "search_web": functools.partial(search_source, "web"),
+        "search_expert": functools.partial(search_source, "expert"),
+        "combine_evidence": combine_evidence,
         "synthesize": synthesize_findings,
     }
 
@@ -198,10 +294,7 @@ def create_kleisli_pipeline():
         return Result.ok(concepts)
 
     def safe_search(concepts: set[str]) -> Result[list[ResearchEvidence], str]:
-        all_evidence = []
-        for source_name in ["academic", "web", "expert"]:
-            evidence = search_source(source_name, concepts)
-            all_evidence.extend(evidence)
+        all_evidence = asyncio.run(search_all_sources(concepts))
 
         if not all_evidence:
             return Result.err("No evidence found")
@@ -243,11 +336,9 @@ def demo_parallel():
     plan = parallel_plan()
 
     def combine_evidence_lists(evidence_lists):
-        combined = []
-        for evidence_list in evidence_lists:
-            if isinstance(evidence_list, list):
-                combined.extend(evidence_list)
-        return combined
+        return list(chain.from_iterable(
+            evidence_list for evidence_list in evidence_lists if isinstance(evidence_list, list)
+        ))
 
     executable = compile_plan(actions, plan, aggregate_fn=combine_evidence_lists)
     result = executable(query)
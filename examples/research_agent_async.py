@@ -58,11 +58,9 @@ async def search_web(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, An
         for keyword in keywords[:3]  # Limit to 3 results
     ]
 
-    new_state = dict(state)
-    new_state["web_results"] = results
-    new_state["web_searched"] = True
-
-    return new_state
+    # Return only the keys this branch owns; the parallel merge folds
+    # branch results onto the pre-branch state
+    return {"web_results": results, "web_searched": True}
 
 
 async def search_academic(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
@@ -84,11 +82,7 @@ async def search_academic(state: dict[str, Any], ctx: dict[str, Any]) -> dict[st
         for keyword in keywords[:2]  # Limit to 2 results
     ]
 
-    new_state = dict(state)
-    new_state["academic_results"] = results
-    new_state["academic_searched"] = True
-
-    return new_state
+    return {"academic_results": results, "academic_searched": True}
 
 
 async def synthesize_findings(state: dict[str, Any], ctx: dict[str, Any]) -> dict[str, Any]:
@@ -264,8 +258,9 @@ async def run_research_agent(query: str) -> dict[str, Any]:
             merge_state=patch_combine
         )
 
-    # Export observability data
-    trace_export = obs.export_trace("json")
+    # Export observability data; the tracer is shared with concurrent runs,
+    # so keep only this run's spans
+    trace_export = obs.export_trace("json", trace_id=trace_id)
     metrics_export = obs.export_metrics("json")
 
     print("=== Research Agent Results ===")
@@ -302,9 +297,10 @@ async def run_multi_agent_demo():
             """Researcher agent plan."""
             query = state.get("query", "")
 
-            # Search for information
-            web_results = await search_web(state, ctx)
-            academic_results = await search_academic(state, ctx)
+            # Search for information; the two searches are independent
+            web_results, academic_results = await asyncio.gather(
+                search_web(state, ctx), search_academic(state, ctx)
+            )
 
             # Send results to synthesizer
             await researcher.send_message(
@@ -383,10 +379,12 @@ async def main():
         "sustainable energy solutions"
     ]
 
+    # The queries are independent, so research them concurrently
     for query in queries:
         print(f"\nResearching: {query}")
-        result = await run_research_agent(query)
-        print(f"Completed: {result.get('synthesized', False)}")
+    results = await asyncio.gather(*(run_research_agent(query) for query in queries))
+    for query, result in zip(queries, results, strict=True):
+        print(f"Completed {query}: {result.get('synthesized', False)}")
 
     # Multi-agent demo
     print("\n2. Multi-Agent Communication Demo")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 
@@ -72,6 +73,30 @@ class BeliefSystem(Generic[S]):
 
         return BeliefSystem(beliefs=new_beliefs)
 
+    def add_beliefs(
+        self,
+        beliefs: Iterable[tuple[str, float]],
+        confidence: float = 1.0,
+        source: str = "unknown",
+        timestamp: float | None = None
+    ) -> BeliefSystem[S]:
+        """Add many ``(proposition, logit)`` beliefs with a single dict copy."""
+        if timestamp is None:
+            import time
+            timestamp = time.time()
+
+        new_beliefs = dict(self.beliefs)
+        for proposition, logit in beliefs:
+            new_beliefs[proposition] = Belief(
+                proposition=proposition,
+                logit=logit,
+                confidence=confidence,
+                source=source,
+                timestamp=timestamp
+            )
+
+        return BeliefSystem(beliefs=new_beliefs)
+
     def update_belief(
         self,
         proposition: str,
@@ -107,6 +132,43 @@ class BeliefSystem(Generic[S]):
 
         return BeliefSystem(beliefs=new_beliefs)
 
+    def update_beliefs(
+        self,
+        updates: Iterable[tuple[str, float]],
+        source: str = "update",
+        timestamp: float | None = None
+    ) -> BeliefSystem[S]:
+        """Apply many ``(proposition, delta_logit)`` updates with a single dict copy.
+
+        Equivalent to chaining ``update_belief`` in order.
+        """
+        if timestamp is None:
+            import time
+            timestamp = time.time()
+
+        new_beliefs = dict(self.beliefs)
+        for proposition, delta_logit in updates:
+            current_belief = new_beliefs.get(proposition)
+            if current_belief is None:
+                new_beliefs[proposition] = Belief(
+                    proposition=proposition,
+                    logit=delta_logit,
+                    confidence=1.0,
+                    source=source,
+                    timestamp=timestamp
+                )
+            else:
+                new_beliefs[proposition] = Belief(
+                    proposition=proposition,
+                    logit=current_belief.logit + delta_logit,
+                    confidence=min(1.0, current_belief.confidence + 0.1),
+                    source=source,
+                    timestamp=timestamp,
+                    decay_rate=current_belief.decay_rate
+                )
+
+        return BeliefSystem(beliefs=new_beliefs)
+
     def get_belief(self, proposition: str) -> Belief[S] | None:
         """Get a belief by proposition."""
         return self.beliefs.get(proposition)
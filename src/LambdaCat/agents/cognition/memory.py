@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any, Generic, TypeVar
 
 S = TypeVar("S")  # State type
@@ -30,6 +32,15 @@ class AgentState(Generic[S]):
             scratch=self.scratch
         )
 
+    def remember_many(self, entries: Mapping[str, Any]) -> AgentState[S]:
+        """Add many memory entries with a single dict copy."""
+        return AgentState(
+            data=self.data,
+            memory={**self.memory, **entries},
+            beliefs=self.beliefs,
+            scratch=self.scratch
+        )
+
     def recall(self, key: str, default: Any = None) -> Any:
         """Recall a memory entry."""
         return self.memory.get(key, default)
@@ -189,10 +200,10 @@ def consolidate_memory(
     if len(memory) <= max_entries:
         return memory
 
-    # Simple strategy: keep the most recent entries
+    # Simple strategy: keep the most recent entries (dicts keep insertion
+    # order), skipping the oldest without materializing every item first.
     # In a real system, you might want more sophisticated consolidation
-    items = list(memory.items())
-    return dict(items[-max_entries:])
+    return dict(islice(memory.items(), len(memory) - max_entries, None))
 
 
 def merge_memories(
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Generic, TypeVar
 
@@ -22,6 +25,13 @@ class ParallelSpec:
     n_best: int = 1  # for N_BEST policy
     timeout_s: float | None = None  # global timeout
     merge_strategy: str = "left_biased"  # state merge strategy
+    offload_sync: bool = False  # run sync Task branches on a shared thread pool
+
+
+@functools.lru_cache(maxsize=1)
+def _sync_executor() -> ThreadPoolExecutor:
+    """Shared pool for sync branches of offloaded Parallel nodes (created lazily)."""
+    return ThreadPoolExecutor(thread_name_prefix="lambdacat-par")
 
 
 class AsyncCompiler(Generic[S, Ctx]):
@@ -77,11 +87,12 @@ class AsyncCompiler(Generic[S, Ctx]):
         else:
             raise TypeError(f"Unknown plan type: {type(plan)}")
 
-    def _compile_task(self, task: Task[S, Ctx]) -> Effect[S, S]:
+    def _compile_task(self, task: Task[S, Ctx], offload: bool = False) -> Effect[S, S]:
         """Compile a Task to an Effect.
 
         Tasks are the atomic computations in the plan DSL.
-        They can be either sync or async functions.
+        They can be either sync or async functions. With ``offload``, a sync
+        action runs on the shared thread pool instead of blocking the loop.
         """
         if task.name not in self.actions:
             raise KeyError(f"Unknown action: {task.name}")
@@ -103,20 +114,29 @@ class AsyncCompiler(Generic[S, Ctx]):
 
             effect = Effect(run_async)
         else:
-            # Sync action - lift to Effect
+            # Sync action - lift to Effect. Single- vs two-parameter dispatch
+            # is resolved here, once per compile, not on every run; a bad
+            # signature still surfaces as an Err when the task runs.
+            arity_error: Exception | None = None
+            try:
+                n_params = len(inspect.signature(action).parameters)
+            except (TypeError, ValueError) as e:
+                n_params, arity_error = 0, e
+            if arity_error is None and n_params not in (1, 2):
+                arity_error = TypeError(f"Action must accept 1 (s) or 2 (s, ctx) parameters, got {n_params}")
+
             async def run_sync(s: S, ctx: dict[str, object]) -> tuple[S, list[dict[str, object]], Ok[S] | Err[Exception]]:
                 try:
-                    # Handle both single-parameter and two-parameter functions
-                    import inspect
-                    sig = inspect.signature(action)
-                    params = list(sig.parameters.values())
+                    if arity_error is not None:
+                        raise arity_error
 
-                    if len(params) == 1:
+                    if offload:
+                        call = functools.partial(action, s) if n_params == 1 else functools.partial(action, s, ctx)
+                        result = await asyncio.get_running_loop().run_in_executor(_sync_executor(), call)
+                    elif n_params == 1:
                         result = action(s)
-                    elif len(params) == 2:
-                        result = action(s, ctx)
                     else:
-                        raise TypeError(f"Action must accept 1 (s) or 2 (s, ctx) parameters, got {len(params)}")
+                        result = action(s, ctx)
 
                     return (result, [{"span": f"task:{task.name}"}], Ok(result))
                 except Exception as e:
@@ -159,11 +179,18 @@ class AsyncCompiler(Generic[S, Ctx]):
         if not par.items:
             return Effect.pure(lambda s: s)  # Identity
 
-        # Compile all items
-        effects = [self._compile_recursive(item) for item in par.items]
+        # Compile all items; sync Task branches go to the thread pool when the
+        # spec asks for it, so they overlap instead of running back to back
+        spec = self.default_parallel_spec
+        offload = spec.offload_sync and len(par.items) > 1
+        effects = [
+            self._compile_task(item, offload=True) if offload and isinstance(item, Task)
+            else self._compile_recursive(item)
+            for item in par.items
+        ]
 
         # Use parallel composition with policy
-        return self._compile_parallel_with_policy(effects, self.default_parallel_spec)
+        return self._compile_parallel_with_policy(effects, spec)
 
     def _compile_parallel_with_policy(self, effects: list[Effect[S, S]], spec: ParallelSpec) -> Effect[S, S]:
         """Compile parallel effects with specific policy."""
@@ -237,14 +264,17 @@ class AsyncCompiler(Generic[S, Ctx]):
         This uses monadic bind in a loop for iteration.
         """
         body_effect = self._compile_recursive(loop.body)
+        # Bind the predicate and body once so each pass skips the attribute lookups
+        predicate = loop.predicate
+        run_body = body_effect.run
 
         async def run_loop(s: S, ctx: dict[str, object]) -> tuple[S, list[dict[str, object]], Ok[S] | Err[Exception]]:
             current_state = s
             all_traces = []
 
-            while loop.predicate(current_state):
+            while predicate(current_state):
                 # Run body effect
-                new_state, trace, result = await body_effect.run(current_state, ctx)
+                new_state, trace, result = await run_body(current_state, ctx)
                 all_traces.extend(trace)
 
                 if isinstance(result, Err):
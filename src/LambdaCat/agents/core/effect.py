@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Iterable
 from dataclasses import dataclass
 from typing import Any, Callable, Generic, TypeVar, Union
 
@@ -58,6 +58,27 @@ class Effect(Generic[S, A]):
             return (s, [], Ok(value))
         return cls(go)
 
+    @classmethod
+    def pure_many(cls, values: Iterable[A]) -> list[Effect[S, A]]:
+        """Lift each value into a pure Effect in a single C-level map."""
+        return list(map(cls.pure, values))
+
+    @classmethod
+    def chain_pure(cls, initial: A, fns: Iterable[Callable[[A], A]]) -> Effect[S, A]:
+        """Fuse ``pure(initial)`` followed by pure binds into a single Effect.
+
+        Equivalent to binding each ``f`` as ``lambda x: Effect.pure(f(x))``,
+        but runs the steps in one loop instead of one nested Effect per step.
+        """
+        steps = tuple(fns)
+
+        async def go(s: S, ctx: dict[str, Any]) -> tuple[S, Trace, Result[A]]:
+            value = initial
+            for f in steps:
+                value = f(value)
+            return (s, [], Ok(value))
+        return cls(go)
+
     def map(self, f: Callable[[A], B]) -> Effect[S, B]:
         """Functor map: fmap f (Effect g) = Effect (f . g)"""
         async def go(s: S, ctx: dict[str, Any]) -> tuple[S, Trace, Result[B]]:
@@ -5,6 +5,7 @@ import json
 import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any
 from uuid import uuid4
@@ -121,7 +122,17 @@ class Tracer:
     def __init__(self):
         self.spans: list[Span] = []
         self.active_spans: dict[str, Span] = {}
-        self.trace_id: str | None = None
+        # Held per context, so concurrent tasks can each run their own trace
+        self._trace_id: ContextVar[str | None] = ContextVar(f"trace_id_{id(self)}", default=None)
+
+    @property
+    def trace_id(self) -> str | None:
+        """The trace started in the current context, if any."""
+        return self._trace_id.get()
+
+    @trace_id.setter
+    def trace_id(self, trace_id: str | None) -> None:
+        self._trace_id.set(trace_id)
 
     def start_trace(self, trace_id: str | None = None) -> str:
         """Start a new trace."""
@@ -161,9 +172,11 @@ class Tracer:
 
         return finished_span
 
-    def get_trace(self) -> list[Span]:
-        """Get all spans in the current trace."""
-        return list(self.spans)
+    def get_trace(self, trace_id: str | None = None) -> list[Span]:
+        """Get all finished spans, or only those of ``trace_id``."""
+        if trace_id is None:
+            return list(self.spans)
+        return [span for span in self.spans if span.trace_id == trace_id]
 
     def clear_trace(self) -> None:
         """Clear the current trace."""
@@ -171,13 +184,14 @@ class Tracer:
         self.active_spans.clear()
         self.trace_id = None
 
-    def export_trace(self, format: str = "json") -> str:
-        """Export the trace in the specified format."""
+    def export_trace(self, format: str = "json", trace_id: str | None = None) -> str:
+        """Export the trace in the specified format, optionally only ``trace_id``'s spans."""
+        spans = self.get_trace(trace_id)
         if format == "json":
-            return json.dumps([span.to_dict() for span in self.spans], indent=2)
+            return json.dumps([span.to_dict() for span in spans], indent=2)
         elif format == "text":
             lines = []
-            for span in self.spans:
+            for span in spans:
                 lines.append(f"Span: {span.name} ({span.duration_ms:.2f}ms)")
                 for key, value in span.tags.items():
                     lines.append(f"  {key}: {value}")
@@ -364,17 +378,17 @@ class ObservabilityManager:
         """Create a timer metric."""
         return self.metrics.timer(name, tags)
 
-    def get_trace(self) -> list[Span]:
+    def get_trace(self, trace_id: str | None = None) -> list[Span]:
         """Get the current trace."""
-        return self.tracer.get_trace()
+        return self.tracer.get_trace(trace_id)
 
     def get_metrics(self) -> list[Metric]:
         """Get all metrics."""
         return self.metrics.get_metrics()
 
-    def export_trace(self, format: str = "json") -> str:
+    def export_trace(self, format: str = "json", trace_id: str | None = None) -> str:
         """Export the trace."""
-        return self.tracer.export_trace(format)
+        return self.tracer.export_trace(format, trace_id)
 
     def export_metrics(self, format: str = "json") -> str:
         """Export metrics."""
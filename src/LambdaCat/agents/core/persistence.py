@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import enum
 import json
+import math
 import sqlite3
+import uuid
 from abc import ABC, abstractmethod
 from dataclasses import asdict
 from pathlib import Path
@@ -9,9 +12,73 @@ from typing import Any, Callable, Generic, TypeVar
 
 from ..cognition.memory import AgentState
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+    orjson = None
+
 S = TypeVar("S")  # State type
 
 
+_JSON_KEY_TYPES = (str, int, float, bool, type(None))
+
+
+def _needs_stdlib_json(obj: Any) -> bool:
+    """Whether orjson would encode ``obj`` differently from the stdlib.
+
+    orjson writes NaN and infinities as ``null`` and natively encodes UUIDs,
+    plain enums and keys the stdlib rejects; none of these have a passthrough option.
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(
+            not isinstance(key, _JSON_KEY_TYPES) or _needs_stdlib_json(key) or _needs_stdlib_json(value)
+            for key, value in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return any(map(_needs_stdlib_json, obj))
+    return isinstance(obj, (uuid.UUID, enum.Enum)) and not isinstance(obj, (int, str))
+
+
+def _reject_json(obj: Any) -> Any:
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Encode as indented UTF-8 JSON, using orjson when installed.
+
+    Both paths accept the same inputs: orjson passes datetimes and dataclasses
+    to ``_reject_json`` like the stdlib would, and values it would encode
+    differently or rejects (e.g. ints beyond 64 bits) go to the stdlib.
+    """
+    if _HAS_ORJSON and not _needs_stdlib_json(data):
+        try:
+            return orjson.dumps(
+                data,
+                default=_reject_json,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _load_json_bytes(raw: bytes) -> Any:
+    """Decode UTF-8 JSON, using orjson when installed."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals written by the stdlib encoder
+    return json.loads(raw)
+
+
 class PersistenceBackend(ABC, Generic[S]):
     """Abstract base class for persistence backends."""
 
@@ -63,8 +130,7 @@ class JSONFileBackend(PersistenceBackend[S]):
         else:
             data = state
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        file_path.write_bytes(_dump_json_bytes(data))
 
     async def load(self, key: str, constructor: Callable[[dict[str, Any]], S]) -> S | None:
         """Load state from JSON file."""
@@ -74,8 +140,7 @@ class JSONFileBackend(PersistenceBackend[S]):
             return None
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json_bytes(file_path.read_bytes())
             return constructor(data)
         except (json.JSONDecodeError, FileNotFoundError):
             return None
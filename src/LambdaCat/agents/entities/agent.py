@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
 from typing import Callable, Generic, TypeVar
 
-from ..cognition.memory import AgentState
+from ..cognition.memory import AgentState, consolidate_memory
 from ..core.bus import Message, MessageBus
 from ..core.compile_async import AsyncCompiler
 from .goals import Goal
@@ -30,6 +31,7 @@ class AgentEntity(Generic[S]):
     persist: Callable[[AgentState[S]], None]
     context: dict[str, object] = field(default_factory=dict)
     running: bool = False
+    memory_limit: int | None = None  # keep only the newest N memory entries
 
     async def perceive(self, message: Message[object]) -> None:
         """Process incoming messages and update beliefs."""
@@ -100,28 +102,83 @@ class AgentEntity(Generic[S]):
                 delta_logit=-0.3
             )
 
-    async def run(self) -> None:
-        """Main agent loop: perceive messages and act."""
-        self.running = True
+    def deliver_many(self, messages: Iterable[Message[object]]) -> None:
+        """Enqueue several messages without awaiting between them.
 
-        while self.running:
+        The inbox is unbounded, so ``put_nowait`` never blocks; the agent
+        loop is woken once and drains the whole batch.
+        """
+        for message in messages:
+            self.inbox.put_nowait(message)
+
+    @staticmethod
+    def _is_stop(message: Message[object]) -> bool:
+        return isinstance(message.payload, str) and message.payload == "__STOP__"
+
+    def _drain_inbox(self, first: Message[object]) -> list[Message[object]]:
+        """Return ``first`` plus the messages already waiting in the inbox.
+
+        Draining ends at a ``__STOP__`` message, so anything queued after it
+        stays in the inbox.
+        """
+        batch = [first]
+        while not self._is_stop(batch[-1]):
             try:
-                message = await asyncio.wait_for(self.inbox.get(), timeout=1.0)
+                batch.append(self.inbox.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    def _remember_error(self, error: Exception) -> None:
+        self.state = self.state.remember(
+            f"error_{asyncio.get_event_loop().time()}",
+            {"error": str(error), "type": "run_loop"}
+        )
 
-                if isinstance(message.payload, str) and message.payload == "__STOP__":
-                    break
+    async def run(self) -> None:
+        """Main agent loop: perceive messages and act.
 
-                await self.perceive(message)
-                await self.act_once()
-                self.persist(self.state)
+        Messages that arrive together are perceived as one batch, followed by
+        a single action cycle and persist. A message that fails to perceive is
+        recorded as an error without dropping the rest of the batch.
+        """
+        self.running = True
 
+        while self.running:
+            try:
+                first = await asyncio.wait_for(self.inbox.get(), timeout=1.0)
             except asyncio.TimeoutError:
                 continue
-            except Exception as e:
-                self.state = self.state.remember(
-                    f"error_{asyncio.get_event_loop().time()}",
-                    {"error": str(e), "type": "run_loop"}
-                )
+
+            stop = False
+            perceived = False
+            for message in self._drain_inbox(first):
+                if self._is_stop(message):
+                    stop = True
+                    break
+                try:
+                    await self.perceive(message)
+                    perceived = True
+                except Exception as e:
+                    self._remember_error(e)
+
+            if perceived:
+                try:
+                    await self.act_once()
+                    self._trim_memory()
+                    self.persist(self.state)
+                except Exception as e:
+                    self._remember_error(e)
+            if stop:
+                break
+
+    def _trim_memory(self) -> None:
+        """Drop the oldest memory entries beyond ``memory_limit``."""
+        if self.memory_limit is not None and len(self.state.memory) > self.memory_limit:
+            self.state = replace(
+                self.state,
+                memory=consolidate_memory(self.state.memory, self.memory_limit)
+            )
 
     async def stop(self) -> None:
         """Stop the agent."""
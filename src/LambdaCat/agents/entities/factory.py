@@ -9,7 +9,7 @@ from typing import Callable, TypeVar
 
 from ..cognition.memory import AgentState
 from ..core.bus import Message, MessageBus
-from ..core.compile_async import AsyncCompiler
+from ..core.compile_async import AsyncCompiler, ParallelSpec
 from .agent import AgentEntity
 from .bus import SimpleBus
 from .goals import Goal
@@ -25,9 +25,17 @@ def create_agent_entity(
     goal_to_plan: dict[str, object],  # Plan DSL ASTs
     bus: MessageBus | None = None,
     persistence_path: str | None = None,
-    context: dict[str, object] | None = None
+    context: dict[str, object] | None = None,
+    parallel_spec: ParallelSpec | None = None,
+    memory_limit: int | None = None
 ) -> AgentEntity[S]:
-    """Create an agent entity with the given configuration."""
+    """Create an agent entity with the given configuration.
+
+    ``parallel_spec`` is handed to the agent's compiler; e.g.
+    ``ParallelSpec(offload_sync=True)`` runs sync skills in Parallel plan
+    branches on the shared thread pool instead of on the event loop.
+    ``memory_limit`` bounds the agent's memory to its newest entries.
+    """
     if bus is None:
         bus = MessageBus()
 
@@ -48,7 +56,7 @@ def create_agent_entity(
             pass
 
     policy = SimpleIntentionPolicy(goal_to_plan)
-    runtime = AsyncCompiler(actions=skills)
+    runtime = AsyncCompiler(actions=skills, default_parallel_spec=parallel_spec)
     state = AgentState()
 
     return AgentEntity(
@@ -61,7 +69,8 @@ def create_agent_entity(
         inbox=inbox,
         bus=bus,
         persist=persist_func,
-        context=context or {}
+        context=context or {},
+        memory_limit=memory_limit
     )
 
 
@@ -95,7 +95,8 @@ def run_structured_plan(
         return wrapped
 
     traced_impl: Mapping[str, Action[State, Ctx]] = {k: _wrap(k, v) for k, v in implementation.items()}
-    runner = compile_plan(traced_impl, plan, choose_fn=choose_fn, aggregate_fn=aggregate_fn)
+    # The traced wrappers are new on every call, so caching could never hit
+    runner = compile_plan(traced_impl, plan, choose_fn=choose_fn, aggregate_fn=aggregate_fn, cache=False)
     output = runner(input_value, ctx)
     return RunReport(output=output, score=None, trace=tuple(traces))
 
@@ -139,8 +140,9 @@ def quick_functor_laws(
     if id_name is not None:
         if id_name not in implementation:
             raise AssertionError(f"identity action '{id_name}' not in implementation")
+        id_plan = Formal1((id_name,))
         for x in samples:
-            if run_plan(Formal1((id_name,)), implementation, x, ctx=ctx).output != x:
+            if run_plan(id_plan, implementation, x, ctx=ctx).output != x:
                 raise AssertionError("Identity law failed: F(id)(x) != x")
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from collections.abc import Awaitable, Mapping
 from inspect import signature
 from typing import Callable, Generic, Protocol, TypeVar
@@ -8,8 +9,9 @@ from typing import Callable, Generic, Protocol, TypeVar
 from ..core.fp.kleisli import Kleisli
 from ..core.fp.typeclasses import MonadT
 from ..core.presentation import Formal1
-from .actions import Plan
+from .actions import Plan, Sequence, Task
 from .core.compile_async import ActionRegistry, AsyncCompiler, ParallelSpec
+from .core.effect import Effect, Err
 
 State = TypeVar("State")
 Ctx = TypeVar("Ctx")
@@ -97,6 +99,60 @@ def compile_to_kleisli(
     return Kleisli(kleisli_run)
 
 
+def _linear_task_names(plan: Plan[State, Ctx]) -> tuple[str, ...] | None:
+    """Flatten a plan made only of Tasks and Sequences; None if it has other nodes."""
+    if isinstance(plan, Task):
+        return (plan.name,)
+    if isinstance(plan, Sequence):
+        names: list[str] = []
+        for item in plan.items:
+            sub = _linear_task_names(item)
+            if sub is None:
+                return None
+            names.extend(sub)
+        return tuple(names)
+    return None
+
+
+def _bind_step(fn: Action[State, Ctx]) -> Callable[[State, Ctx], State | Awaitable[State]]:
+    """Resolve an action's arity once, returning a uniform ``(s, ctx)`` callable."""
+    if asyncio.iscoroutinefunction(fn) or len(signature(fn).parameters) != 1:
+        return fn
+    return lambda s, ctx: fn(s)
+
+
+def _fuse_linear(
+    implementation: Mapping[str, Action[State, Ctx]],
+    names: tuple[str, ...],
+) -> Callable[[State, Ctx | None], Awaitable[State]]:
+    """Compile a linear plan to one runner over a pre-resolved tuple of steps.
+
+    Skips the per-step Effect/bind/trace machinery; behaviour (including the
+    ``RuntimeError`` on failure) matches the general ``compile_plan`` path.
+    """
+    for name in names:
+        if name not in implementation:
+            raise KeyError(f"Unknown action: {name}")
+    steps = tuple(_bind_step(implementation[name]) for name in names)
+
+    async def run_fused(x: State, ctx: Ctx | None = None) -> State:
+        ctx = ctx or {}
+        value = x
+        try:
+            for step in steps:
+                result = await _maybe_await(step(value, ctx))
+                if isinstance(result, Effect):
+                    result, _, outcome = await result.run(value, ctx)
+                    if isinstance(outcome, Err):
+                        raise outcome.error
+                value = result
+        except Exception as e:
+            raise RuntimeError(f"Plan execution failed: {e}") from e
+        return value
+
+    return run_fused
+
+
 def compile_plan(
     implementation: Mapping[str, Action[State, Ctx]],
     plan: Plan[State, Ctx],
@@ -104,11 +160,51 @@ def compile_plan(
     choose_fn: Callable[[list[object]], int] | None = None,
     aggregate_fn: Callable[[list[object]], object] | None = None,
     parallel_spec: ParallelSpec | None = None,
+    cache: bool = True,
 ) -> Callable[[State, Ctx | None], Awaitable[State]]:
     """Compile a plan to an async executable function.
 
-    This is the main entry point for plan compilation.
+    This is the main entry point for plan compilation. Linear plans (Tasks
+    and Sequences only) are fused into a single runner at compile time.
+    Results are memoized on the implementation's items, the plan and the
+    parallel spec, so recompiling an identical plan is a cache hit. Pass
+    ``cache=False`` for one-off registries (e.g. freshly wrapped actions)
+    that could never hit the cache.
     """
+    items = tuple(implementation.items())
+    if cache and _is_hashable((items, plan, parallel_spec)):
+        return _compile_plan_cached(items, plan, parallel_spec)
+    return _compile_plan(implementation, plan, parallel_spec)
+
+
+def _is_hashable(key: object) -> bool:
+    try:
+        hash(key)
+    except TypeError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_plan_cached(
+    items: tuple[tuple[str, Action[State, Ctx]], ...],
+    plan: Plan[State, Ctx],
+    parallel_spec: ParallelSpec | None,
+) -> Callable[[State, Ctx | None], Awaitable[State]]:
+    """Memoized ``_compile_plan``; the key captures the registry's contents, not its id."""
+    return _compile_plan(dict(items), plan, parallel_spec)
+
+
+def _compile_plan(
+    implementation: Mapping[str, Action[State, Ctx]],
+    plan: Plan[State, Ctx],
+    parallel_spec: ParallelSpec | None,
+) -> Callable[[State, Ctx | None], Awaitable[State]]:
+    """Compile a plan without caching (see ``compile_plan``)."""
+    names = _linear_task_names(plan)
+    if names is not None:
+        return _fuse_linear(implementation, names)
+
     # Convert to ActionRegistry format
     actions: ActionRegistry[State] = {}
     for name, action in implementation.items():
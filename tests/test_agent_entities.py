@@ -1,5 +1,6 @@
 """Tests for agent entities system."""
 
+import asyncio
 import json
 import tempfile
 from pathlib import Path
@@ -213,6 +214,61 @@ class TestAgentEntity:
         # Should have updated memory with execution results
         assert len(agent_entity.state.memory) > initial_memory
 
+    async def test_deliver_many_runs_one_cycle_per_batch(self, agent_entity):
+        """Test that a delivered batch is perceived together and acted on once."""
+        messages = [
+            Message.create(topic="test", payload={"observation": {"n": i}}, sender="test_sender")
+            for i in range(3)
+        ]
+        agent_entity.deliver_many(messages)
+        agent_entity.deliver_many([Message.create(topic="control", payload="__STOP__", sender="test")])
+
+        await agent_entity.run()
+
+        assert agent_entity.inbox.empty()
+        executions = [key for key in agent_entity.state.memory if key.startswith("execution_")]
+        assert len(executions) == 1
+
+    async def test_failing_message_keeps_rest_of_batch(self, agent_entity):
+        """Test that one failing message neither drops the batch nor a queued stop."""
+        perceived = []
+        perceive = agent_entity.perceive
+
+        async def flaky_perceive(message):
+            if message.payload["observation"]["n"] == 0:
+                raise ValueError("bad message")
+            perceived.append(message.payload["observation"]["n"])
+            await perceive(message)
+
+        agent_entity.perceive = flaky_perceive
+        agent_entity.deliver_many([
+            *(Message.create(topic="test", payload={"observation": {"n": i}}, sender="test_sender")
+              for i in range(3)),
+            Message.create(topic="control", payload="__STOP__", sender="test"),
+            Message.create(topic="test", payload={"observation": {"n": 3}}, sender="test_sender"),
+        ])
+
+        await asyncio.wait_for(agent_entity.run(), timeout=2.0)
+
+        assert perceived == [1, 2]
+        assert any(key.startswith("error_") for key in agent_entity.state.memory)
+        assert agent_entity.inbox.qsize() == 1  # message after __STOP__ stays queued
+
+    async def test_memory_limit(self, agent_entity):
+        """Test that the run loop keeps only the newest memory entries."""
+        agent_entity.memory_limit = 2
+        for i in range(5):
+            agent_entity.state = agent_entity.state.remember(f"old_{i}", i)
+
+        agent_entity.deliver_many([
+            Message.create(topic="test", payload={"observation": {"n": 1}}, sender="test_sender"),
+            Message.create(topic="control", payload="__STOP__", sender="test"),
+        ])
+        await agent_entity.run()
+
+        assert len(agent_entity.state.memory) == 2
+        assert not any(key.startswith("old_") for key in agent_entity.state.memory)
+
     async def test_stop(self, agent_entity):
         """Test agent stopping."""
         agent_entity.running = True
@@ -241,6 +297,21 @@ class TestFactory:
         assert len(agent.goals) == 1
         assert "test_skill" in agent.skills
 
+    def test_create_agent_entity_parallel_spec(self):
+        """Test that a parallel spec reaches the agent's compiler."""
+        from src.LambdaCat.agents.core.compile_async import ParallelSpec
+
+        spec = ParallelSpec(offload_sync=True)
+        agent = create_agent_entity(
+            agent_id="pool_agent",
+            goals=[],
+            skills={},
+            goal_to_plan={},
+            parallel_spec=spec
+        )
+
+        assert agent.runtime.default_parallel_spec is spec
+
     def test_create_agent_with_persistence(self):
         """Test agent creation with persistence."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -14,20 +14,28 @@ This tests the complete async agent stack including:
 """
 
 import asyncio
+import math
 import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
+from uuid import uuid4
 
 import pytest
 
 from src.LambdaCat.agents.actions import parallel, sequence, task
+from src.LambdaCat.agents.cognition.beliefs import create_belief_system
 from src.LambdaCat.agents.cognition.memory import AgentState
 from src.LambdaCat.agents.core.bus import create_agent_communicator, create_bus
-from src.LambdaCat.agents.core.compile_async import AsyncCompiler, run_plan
+from src.LambdaCat.agents.core.compile_async import AsyncCompiler, ParallelSpec, run_plan
 from src.LambdaCat.agents.core.effect import Effect, Ok
 from src.LambdaCat.agents.core.instruments import get_observability
 from src.LambdaCat.agents.core.lens_effect import LensLaws, dict_lens, with_lens
 from src.LambdaCat.agents.core.patch import Patch, patch_combine
 from src.LambdaCat.agents.core.persistence import PersistenceManager, create_backend
+from src.LambdaCat.agents.runtime import compile_plan
 from src.LambdaCat.agents.tools.http import create_http_adapter
 from src.LambdaCat.agents.tools.llm import create_mock_llm
 
@@ -48,6 +56,16 @@ class TestEffectMonad:
         assert result.value == "test_value"
         assert len(trace) == 0
 
+    @pytest.mark.asyncio
+    async def test_pure_many(self):
+        """Test batched pure effect creation."""
+        effects = Effect.pure_many(["a", "b", "c"])
+        state = {"data": "initial"}
+
+        values = [(await effect.run(state, {}))[2].value for effect in effects]
+
+        assert values == ["a", "b", "c"]
+
     @pytest.mark.asyncio
     async def test_effect_map(self):
         """Test effect mapping."""
@@ -73,6 +91,20 @@ class TestEffectMonad:
 
         assert result.value == "processed_test"
 
+    @pytest.mark.asyncio
+    async def test_chain_pure_matches_bind(self):
+        """Test fused pure chain agrees with the equivalent bind chain."""
+        steps = [lambda x, i=i: f"{x}_{i}" for i in range(5)]
+        bound = Effect.pure("start")
+        for f in steps:
+            bound = bound.bind(lambda x, f=f: Effect.pure(f(x)))
+        state = {"data": "initial"}
+
+        _, _, fused_result = await Effect.chain_pure("start", steps).run(state, {})
+        _, _, bound_result = await bound.run(state, {})
+
+        assert fused_result.value == bound_result.value == "start_0_1_2_3_4"
+
     @pytest.mark.asyncio
     async def test_parallel_composition(self):
         """Test parallel effect composition."""
@@ -277,6 +309,92 @@ class TestAsyncCompiler:
         assert result_state["fast"] is True
         assert "slow" not in result_state
 
+    @pytest.mark.asyncio
+    async def test_sync_action_arity(self):
+        """Test one- and two-parameter sync actions, and a bad arity as Err."""
+        actions = {
+            "one": lambda s: {**s, "one": True},
+            "two": lambda s, ctx: {**s, "two": ctx["flag"]},
+            "bad": lambda: None,
+        }
+        compiler = AsyncCompiler(actions)
+
+        result_state, _, result = await compiler.compile(sequence(task("one"), task("two"))).run({}, {"flag": 1})
+        assert isinstance(result, Ok)
+        assert result_state == {"one": True, "two": 1}
+
+        _, _, result = await compiler.compile(task("bad")).run({}, {})
+        assert not isinstance(result, Ok)
+
+    @pytest.mark.asyncio
+    async def test_parallel_offload_sync(self):
+        """Test that sync branches overlap when offloaded to the thread pool."""
+        # Each branch waits for the other, so they only finish if both run at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        def blocking(name: str):
+            def action(state: dict[str, Any]) -> dict[str, Any]:
+                barrier.wait()
+                return {**state, name: True}
+            return action
+
+        actions = {"a": blocking("a"), "b": blocking("b")}
+        plan = parallel(task("a"), task("b"))
+
+        compiler = AsyncCompiler(actions, default_parallel_spec=ParallelSpec(offload_sync=True))
+        effect = compiler.compile(plan)
+
+        result_state, _, result = await effect.run({"data": "initial"}, {})
+
+        assert isinstance(result, Ok)
+        assert result_state["a"] is True
+        assert result_state["b"] is True
+
+
+class TestCompilePlan:
+    """Test compile_plan entry point."""
+
+    @pytest.mark.asyncio
+    async def test_linear_plan_is_fused(self):
+        """Test linear plans with mixed sync/async and 1/2-arg actions."""
+        async def add_a(state: str, ctx: dict[str, Any]) -> str:
+            return state + "a"
+
+        actions = {"a": add_a, "b": lambda s: s + "b", "c": lambda s, ctx: s + ctx["suffix"]}
+        run = compile_plan(actions, sequence(task("a"), sequence(task("b"), task("c"))))
+
+        assert await run("x", {"suffix": "c"}) == "xabc"
+
+    def test_compile_plan_is_memoized(self):
+        """Test identical registries and plans share one compiled runner."""
+        def add_a(state: str) -> str:
+            return state + "a"
+
+        plan = sequence(task("a"), task("a"))
+        run = compile_plan({"a": add_a}, plan)
+
+        assert compile_plan({"a": add_a}, plan) is run
+        assert compile_plan({"a": lambda s: s}, plan) is not run
+        assert compile_plan({"a": add_a}, plan, cache=False) is not run
+
+        spec = ParallelSpec(offload_sync=True)
+        assert compile_plan({"a": add_a}, plan, parallel_spec=spec) is compile_plan(
+            {"a": add_a}, plan, parallel_spec=ParallelSpec(offload_sync=True)
+        )
+
+    @pytest.mark.asyncio
+    async def test_linear_plan_errors(self):
+        """Test unknown actions fail at compile time and step errors at run time."""
+        def boom(state: str) -> str:
+            raise ValueError("boom")
+
+        with pytest.raises(KeyError):
+            compile_plan({}, task("missing"))
+
+        run = compile_plan({"boom": boom}, sequence(task("boom")))
+        with pytest.raises(RuntimeError, match="boom"):
+            await run("x")
+
 
 class TestLensIntegration:
     """Test lens integration with effects."""
@@ -335,6 +453,39 @@ class TestMemoryAndBeliefs:
         assert new_state.recall("nonexistent") is None
         assert new_state.recall("nonexistent", "default") == "default"
 
+    def test_remember_many(self):
+        """Test bulk memory insertion."""
+        state = AgentState().remember("a", 1)
+
+        new_state = state.remember_many({"b": 2, "c": 3})
+        assert new_state.memory == {"a": 1, "b": 2, "c": 3}
+        assert state.memory == {"a": 1}  # Original unchanged
+        assert state.remember_many(MappingProxyType({"b": 2})).memory == {"a": 1, "b": 2}
+
+    def test_add_beliefs(self):
+        """Test bulk belief insertion."""
+        system = create_belief_system().add_belief("a", 1.0)
+
+        new_system = system.add_beliefs([("b", 0.5), ("c", -0.5)], source="bulk")
+        assert new_system.get_belief_logit("b") == 0.5
+        assert new_system.get_belief("c").source == "bulk"
+        assert set(new_system.beliefs) == {"a", "b", "c"}
+        assert set(system.beliefs) == {"a"}  # Original unchanged
+
+    def test_update_beliefs(self):
+        """Test bulk belief updates match chained update_belief calls."""
+        system = create_belief_system().add_belief("a", 1.0, confidence=0.5)
+        updates = [("a", 0.5), ("b", -1.0), ("a", 0.25)]
+
+        chained = system
+        for proposition, delta in updates:
+            chained = chained.update_belief(proposition, delta, "bulk", timestamp=1.0)
+        batched = system.update_beliefs(updates, "bulk", timestamp=1.0)
+
+        assert batched.beliefs == chained.beliefs
+        assert batched.get_belief_logit("a") == 1.75
+        assert set(system.beliefs) == {"a"}  # Original unchanged
+
     def test_belief_operations(self):
         """Test belief operations."""
         state = AgentState()
@@ -379,6 +530,37 @@ class TestPersistence:
             assert loaded_state is not None
             assert loaded_state.data == {"key": "value"}
 
+    @pytest.mark.asyncio
+    async def test_json_file_roundtrip(self):
+        """Test JSON files keep non-ASCII text, non-string keys and non-finite floats."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            backend = create_backend("json", base_path=temp_dir)
+
+            data = {"text": "naïve ✓", 1: [1.5, None], "big": 2**70}
+            await backend.save("checkpoint", data)
+            loaded = await backend.load("checkpoint", lambda x: x)
+            assert loaded == {"text": "naïve ✓", "1": [1.5, None], "big": 2**70}
+
+            await backend.save("floats", {"logit": float("inf"), "low": float("-inf"), "p": float("nan")})
+            floats = await backend.load("floats", lambda x: x)
+            assert floats["logit"] == float("inf")
+            assert floats["low"] == float("-inf")
+            assert math.isnan(floats["p"])
+
+            (Path(temp_dir) / "legacy.json").write_text('{"x": NaN}', encoding="utf-8")
+            legacy = await backend.load("legacy", lambda x: x)
+            assert math.isnan(legacy["x"])
+
+    @pytest.mark.asyncio
+    async def test_json_rejects_types_the_stdlib_rejects(self):
+        """Test JSON files reject datetimes and UUIDs whether or not orjson is installed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            backend = create_backend("json", base_path=temp_dir)
+
+            for value in (datetime(2024, 1, 1), uuid4()):
+                with pytest.raises(TypeError):
+                    await backend.save("bad", {"value": value})
+
     @pytest.mark.asyncio
     async def test_checkpoint_persistence(self):
         """Test checkpoint persistence."""
@@ -471,6 +653,23 @@ class TestObservability:
         assert trace[0].name == "operation1"
         assert trace[1].name == "operation2"
 
+    async def test_concurrent_traces_stay_separate(self):
+        """Test that concurrent tasks each keep their own trace id."""
+        obs = get_observability()
+
+        async def traced(name: str) -> str:
+            trace_id = obs.start_trace()
+            span = obs.start_span(name)
+            await asyncio.sleep(0.01)
+            obs.finish_span(span)
+            return trace_id
+
+        first, second = await asyncio.gather(traced("first"), traced("second"))
+
+        assert [s.name for s in obs.get_trace(first)] == ["first"]
+        assert [s.name for s in obs.get_trace(second)] == ["second"]
+        assert "second" not in obs.export_trace("json", trace_id=first)
+
     def test_metrics(self):
         """Test metrics functionality."""
         obs = get_observability()